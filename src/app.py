@@ -123,7 +123,12 @@ class PDFKnowledgeExtractorApp:
                 # Remove extended attributes if they exist
                 try:
                     import subprocess
-                    subprocess.run(["xattr", "-c", str(log_file)], capture_output=True)
+                    subprocess.run(
+                        ["xattr", "-c", str(log_file)],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        check=False
+                    )
                 except:
                     pass
             
@@ -505,14 +510,20 @@ class PDFKnowledgeExtractorApp:
         except Exception as e:
             logging.error(f"Error saving Excel: {e}")
     
-    def run_gui(self):
-        """Run the GUI version of the application."""
+    def run_gui(self, root=None):
+        """Run the GUI version of the application.
+        
+        Args:
+            root: Existing Tk root window to build the GUI in, e.g. one already
+                showing a loading screen. A new one is created if omitted.
+        """
         try:
             import tkinter as tk
             from tkinter import ttk, filedialog, messagebox
             
             # Create root window
-            root = tk.Tk()
+            if root is None:
+                root = tk.Tk()
             root.title("PDF Knowledge Extractor")
             root.geometry("600x500")
             
@@ -605,6 +616,11 @@ class PDFKnowledgeExtractorApp:
         # Store references
         self.root = root
         self.main_frame = main_frame
+        
+        # Worker threads hand UI updates to the Tk thread through this queue
+        import queue
+        from gui.ui_queue import bind_queue
+        self._post = bind_queue(root, queue.Queue())
     
     def _select_file(self):
         """Open file dialog to select PDF file."""
@@ -661,11 +677,11 @@ class PDFKnowledgeExtractorApp:
             results = self.process_pdf(pdf_file, output_formats)
             
             # Update UI on main thread
-            self.root.after(0, self._extraction_completed, results)
+            self._post(self._extraction_completed, results)
             
         except Exception as e:
             # Show error on main thread
-            self.root.after(0, self._extraction_failed, str(e))
+            self._post(self._extraction_failed, str(e))
     
     def _extraction_completed(self, results):
         """Handle successful extraction completion."""
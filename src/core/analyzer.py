@@ -2,12 +2,24 @@
 AI analysis module using Google Gemini.
 """
 
+import re
 import logging
+import functools
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 import google.generativeai as genai
 from PIL import Image
 
+# List items: "- ", "• ", "* " bullets or "1. " .. "9. " numbering
+_BULLET_RE = re.compile(r'^(?:[-•*]|[1-9]\.) (.*)')
+
+
+@functools.lru_cache(maxsize=8)
+def _category_re(categories: Tuple[str, ...]) -> "re.Pattern":
+    """Regex matching any of the category names, longest first."""
+    names = sorted(categories, key=len, reverse=True)
+    return re.compile("|".join(map(re.escape, names)))
+
 
 class AIAnalyzer:
     """Analyze documents using Google Gemini AI."""
@@ -290,7 +302,8 @@ class AIAnalyzer:
     
     def _parse_detailed_response(self, response_text: str, detailed_text_info: Dict[str, Any]) -> Dict[str, Any]:
         """Parse detailed AI response into structured data."""
-        categories = self.categories.copy()
+        # Fresh lists, so results never leak into self.categories
+        categories = {category: [] for category in self.categories}
         categories["詳細情報"] = []  # Add detailed information category
         
         current_category = None
@@ -299,26 +312,9 @@ class AIAnalyzer:
         # Debug: Log the response for troubleshooting
         logging.debug(f"Detailed AI Response:\n{response_text}")
         
-        # First pass: Look for category headers
-        category_patterns = {}
-        for category in categories.keys():
-            # Try multiple patterns for category detection
-            patterns = [
-                f"{i}. {category}" for i in range(1, 8)
-            ] + [
-                f"**{i}. {category}**" for i in range(1, 8)
-            ] + [
-                f"## {i}. {category}" for i in range(1, 8)
-            ] + [
-                f"### {category}",
-                f"## {category}",
-                f"# {category}",
-                category,
-                f"【{category}】",
-                f"**{category}**",
-                f"*{category}*"
-            ]
-            category_patterns[category] = patterns
+        # Every header form ("1. X", "**X**", "## X", "【X】", ...) contains the
+        # category name itself, so one alternation finds them all
+        category_re = _category_re(tuple(categories))
         
         for i, line in enumerate(lines):
             line = line.strip()
@@ -326,26 +322,20 @@ class AIAnalyzer:
                 continue
                 
             # Check for category headers
-            for category, patterns in category_patterns.items():
-                if any(pattern in line for pattern in patterns):
-                    current_category = category
-                    logging.debug(f"Found category '{category}' at line {i}: {line}")
-                    break
+            if category_re.search(line):
+                # When a line names several categories, the first in category
+                # order wins, not the leftmost in the line
+                current_category = next(c for c in categories if c in line)
+                logging.debug(f"Found category '{current_category}' at line {i}: {line}")
             
             # Extract items with enhanced detection
             if current_category:
                 item = None
                 
-                # Handle bullet points
-                if line.startswith('- ') or line.startswith('• ') or line.startswith('* '):
-                    for bullet in ['- ', '• ', '* ']:
-                        if line.startswith(bullet):
-                            item = line[len(bullet):].strip()
-                            break
-                
-                # Handle numbered items
-                elif line.startswith(tuple(f"{i}. " for i in range(1, 10))):
-                    item = line.split('. ', 1)[1].strip() if '. ' in line else None
+                # Handle bullet points and numbered items
+                bullet = _BULLET_RE.match(line)
+                if bullet:
+                    item = bullet.group(1).strip()
                 
                 # Handle items that start with category name followed by colon
                 elif current_category in line and ':' in line:
@@ -494,7 +484,8 @@ class AIAnalyzer:
     
     def _parse_response(self, response_text: str) -> Dict[str, Any]:
         """Parse AI response into structured data."""
-        categories = self.categories.copy()
+        # Fresh lists, so results never leak into self.categories
+        categories = {category: [] for category in self.categories}
         
         current_category = None
         lines = response_text.split('\n')
@@ -502,26 +493,9 @@ class AIAnalyzer:
         # Debug: Log the response for troubleshooting
         logging.debug(f"AI Response:\n{response_text}")
         
-        # First pass: Look for category headers
-        category_patterns = {}
-        for category in categories.keys():
-            # Try multiple patterns for category detection
-            patterns = [
-                f"{i}. {category}" for i in range(1, 7)
-            ] + [
-                f"**{i}. {category}**" for i in range(1, 7)
-            ] + [
-                f"## {i}. {category}" for i in range(1, 7)
-            ] + [
-                f"### {category}",
-                f"## {category}",
-                f"# {category}",
-                category,
-                f"【{category}】",
-                f"**{category}**",
-                f"*{category}*"
-            ]
-            category_patterns[category] = patterns
+        # Every header form ("1. X", "**X**", "## X", "【X】", ...) contains the
+        # category name itself, so one alternation finds them all
+        category_re = _category_re(tuple(categories))
         
         for i, line in enumerate(lines):
             line = line.strip()
@@ -529,26 +503,20 @@ class AIAnalyzer:
                 continue
                 
             # Check for category headers
-            for category, patterns in category_patterns.items():
-                if any(pattern in line for pattern in patterns):
-                    current_category = category
-                    logging.debug(f"Found category '{category}' at line {i}: {line}")
-                    break
+            if category_re.search(line):
+                # When a line names several categories, the first in category
+                # order wins, not the leftmost in the line
+                current_category = next(c for c in categories if c in line)
+                logging.debug(f"Found category '{current_category}' at line {i}: {line}")
             
             # Extract items - more flexible detection
             if current_category:
                 item = None
                 
-                # Handle bullet points
-                if line.startswith('- ') or line.startswith('• ') or line.startswith('* '):
-                    for bullet in ['- ', '• ', '* ']:
-                        if line.startswith(bullet):
-                            item = line[len(bullet):].strip()
-                            break
-                
-                # Handle numbered items
-                elif line.startswith(tuple(f"{i}. " for i in range(1, 10))):
-                    item = line.split('. ', 1)[1].strip() if '. ' in line else None
+                # Handle bullet points and numbered items
+                bullet = _BULLET_RE.match(line)
+                if bullet:
+                    item = bullet.group(1).strip()
                 
                 # Handle items that start with category name followed by colon
                 elif current_category in line and ':' in line:
@@ -23,17 +23,18 @@ class PDFExtractor:
         self.temp_dir = temp_dir or Path(tempfile.mkdtemp(prefix="pdf_extractor_"))
         self.logger = logging.getLogger(__name__)
         
-    def extract(self, pdf_path: Path) -> Tuple[str, List[Path]]:
+    def extract(self, pdf_path: Path, max_images: int = 10) -> Tuple[str, List[Path]]:
         """Extract text and images from PDF.
         
         Args:
             pdf_path: Path to PDF file
+            max_images: Maximum number of page images to extract
             
         Returns:
             Tuple of (extracted_text, list_of_image_paths)
         """
         text = self.extract_text(pdf_path)
-        images = self.extract_images(pdf_path)
+        images = self.extract_images(pdf_path, max_images=max_images)
         return text, images
     
     def extract_detailed_text(self, pdf_path: Path) -> Dict[str, Any]:
@@ -65,8 +66,7 @@ class PDFExtractor:
                 }
             }
             
-            for page_num in range(len(doc)):
-                page = doc[page_num]
+            for page_num, page in enumerate(doc):
                 page_info = self._extract_page_details(page, page_num)
                 detailed_info['pages'].append(page_info)
                 detailed_info['raw_text'] += page_info['text'] + '\n'
@@ -177,11 +177,11 @@ class PDFExtractor:
                 'total_pages': len(doc),
                 'pages': [],
                 'full_text': '',
+                'total_blocks': 0,
                 'extraction_timestamp': datetime.now().isoformat()
             }
             
-            for page_num in range(len(doc)):
-                page = doc[page_num]
+            for page_num, page in enumerate(doc):
                 
                 # Get raw text
                 raw_text = page.get_text()
@@ -212,6 +212,7 @@ class PDFExtractor:
                 
                 raw_data['pages'].append(page_data)
                 raw_data['full_text'] += raw_text + '\n'
+                raw_data['total_blocks'] += len(page_data['blocks'])
             
             doc.close()
             self.logger.info(f"Extracted raw text from {pdf_path}: {len(raw_data['pages'])} pages, {len(raw_data['full_text'])} characters")
@@ -423,8 +424,7 @@ class PDFExtractor:
             doc = fitz.open(pdf_path)
             text = ""
             
-            for page_num in range(len(doc)):
-                page = doc[page_num]
+            for page in doc:
                 text += page.get_text()
                 
             doc.close()
@@ -447,8 +447,7 @@ class PDFExtractor:
             doc = fitz.open(pdf_path)
             formatted_text = ""
             
-            for page_num in range(len(doc)):
-                page = doc[page_num]
+            for page_num, page in enumerate(doc):
                 page_text = ""
                 
                 # Get text blocks with formatting
@@ -498,8 +497,9 @@ class PDFExtractor:
             doc = fitz.open(pdf_path)
             image_paths = []
             
-            for page_num in range(min(len(doc), max_images)):
-                page = doc[page_num]
+            for page_num, page in enumerate(doc):
+                if page_num >= max_images:
+                    break
                 
                 # Render page to pixmap
                 mat = fitz.Matrix(dpi/72, dpi/72)  # scaling factor for DPI
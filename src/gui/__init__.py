@@ -3,5 +3,6 @@ GUI package for PDF Knowledge Extractor
 """
 
 from .main_window import MainWindow
+from .ui_queue import bind_queue
 
-__all__ = ['MainWindow']
\ No newline at end of file
+__all__ = ['MainWindow', 'bind_queue']
\ No newline at end of file
@@ -8,6 +8,9 @@ from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
 import threading
 import logging
+import queue
+
+from .ui_queue import bind_queue
 
 class MainWindow:
     """Main GUI window for PDF Knowledge Extractor."""
@@ -19,6 +22,10 @@ class MainWindow:
         
         logging.info("Initializing MainWindow")
         
+        # Worker threads hand UI updates to the Tk thread through this queue
+        self._ui_queue = queue.Queue()
+        self._post = bind_queue(self.root, self._ui_queue)
+        
         # Configure window
         self.root.title("PDF Knowledge Extractor")
         self.root.geometry("600x500")
@@ -133,9 +140,10 @@ class MainWindow:
     def setup_gui_logging(self):
         """Setup logging to display in GUI."""
         class GUILogHandler(logging.Handler):
-            def __init__(self, text_widget):
+            def __init__(self, text_widget, post):
                 super().__init__()
                 self.text_widget = text_widget
+                self.post = post
             
             def emit(self, record):
                 # Avoid recursive logging
@@ -143,8 +151,8 @@ class MainWindow:
                     return
                     
                 msg = self.format(record)
-                # Use after to avoid blocking
-                self.text_widget.after(0, lambda: self._insert_text(msg))
+                # Records may come from worker threads; insert on the Tk thread
+                self.post(self._insert_text, msg)
             
             def _insert_text(self, msg):
                 try:
@@ -154,10 +162,10 @@ class MainWindow:
                     pass  # Ignore errors in GUI logging
         
         # Add GUI handler to root logger
-        gui_handler = GUILogHandler(self.log_text)
-        gui_handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-        gui_handler.setLevel(logging.INFO)  # Only show INFO and above
-        logging.getLogger().addHandler(gui_handler)
+        self.gui_handler = GUILogHandler(self.log_text, self._post)
+        self.gui_handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
+        self.gui_handler.setLevel(logging.INFO)  # Only show INFO and above
+        logging.getLogger().addHandler(self.gui_handler)
     
     def select_file(self):
         """Open file dialog to select PDF file."""
@@ -207,11 +215,11 @@ class MainWindow:
             results = self.app.process_pdf(pdf_file, output_formats=output_formats)
             
             # Update UI on main thread
-            self.root.after(0, self.extraction_completed, results)
+            self._post(self.extraction_completed, results)
             
         except Exception as e:
             # Show error on main thread
-            self.root.after(0, self.extraction_failed, str(e))
+            self._post(self.extraction_failed, str(e))
     
     def extraction_completed(self, results):
         """Handle successful extraction completion."""
@@ -235,5 +243,7 @@ class MainWindow:
     
     def on_closing(self):
         """Handle window closing."""
+        # Later records (worker threads, cleanup) must not reach the dead window
+        logging.getLogger().removeHandler(self.gui_handler)
         self.root.quit()
         self.root.destroy()
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""
+Thread-safe bridge for running UI callbacks on the Tk thread.
+"""
+
+import os
+import queue
+import threading
+import tkinter as tk
+from typing import Any, Callable
+
+# Fallback poll interval where Tk has no file handler support (Windows)
+POLL_INTERVAL_MS = 50
+
+
+def bind_queue(root: tk.Tk, q: "queue.Queue") -> Callable[..., None]:
+    """Drain a queue of UI callbacks on the Tk thread.
+    
+    Background threads must not touch Tk widgets. Instead they call the
+    returned ``post(callback, *args)``, which queues the callback and wakes
+    the Tk event loop through a self-pipe registered with
+    ``createfilehandler``, so no timer polling is needed.
+    
+    Args:
+        root: Tk root window whose event loop runs the callbacks
+        q: Queue holding (callback, args) tuples
+    
+    Returns:
+        Thread-safe function that schedules a callback on the Tk thread
+    """
+    def drain():
+        while True:
+            try:
+                callback, args = q.get_nowait()
+            except queue.Empty:
+                return
+            callback(*args)
+    
+    def on_readable(fd, mask):
+        os.read(fd, 4096)
+        drain()
+    
+    r_fd, w_fd = os.pipe()
+    try:
+        os.set_blocking(w_fd, False)
+        root.tk.createfilehandler(r_fd, tk.READABLE, on_readable)
+    except (AttributeError, OSError, tk.TclError):
+        # No file handlers on this platform; poll the queue instead
+        os.close(r_fd)
+        os.close(w_fd)
+        
+        def poll():
+            drain()
+            root.after(POLL_INTERVAL_MS, poll)
+        
+        root.after(POLL_INTERVAL_MS, poll)
+        
+        def post(callback: Callable, *args: Any):
+            q.put((callback, args))
+        
+        return post
+    
+    # Once closed, the fd numbers may be reused by other files, so post()
+    # must never write to them again
+    lock = threading.Lock()
+    closed = False
+    
+    def on_destroy(event):
+        nonlocal closed
+        if event.widget is root:
+            with lock:
+                closed = True
+                root.tk.deletefilehandler(r_fd)
+                os.close(r_fd)
+                os.close(w_fd)
+    
+    root.bind("<Destroy>", on_destroy, add="+")
+    
+    def post(callback: Callable, *args: Any):
+        with lock:
+            if closed:
+                # Window destroyed; nothing left to update
+                return
+            q.put((callback, args))
+            try:
+                os.write(w_fd, b"x")
+            except BlockingIOError:
+                # Pipe is full, so a wake-up is already pending
+                pass
+    
+    return post
@@ -19,7 +19,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from core import PDFExtractor, AIAnalyzer, DataExporter
 from gui import MainWindow as PDFExtractorGUI
-from utils import ConfigManager, setup_logger, NotificationManager
+from utils import ConfigManager, setup_logger, get_notification_manager
 
 
 class PDFKnowledgeExtractorApp:
@@ -35,7 +35,7 @@ class PDFKnowledgeExtractorApp:
         self.config_manager = ConfigManager(config_path)
         
         # Setup logging
-        output_dir = Path(self.config_manager.get('output_dir')).expanduser()
+        output_dir = self.config_manager.output_dir
         output_dir.mkdir(parents=True, exist_ok=True)
         
         self.logger = setup_logger(
@@ -62,7 +62,7 @@ class PDFKnowledgeExtractorApp:
         self.ai_analyzer = AIAnalyzer(self.config_manager.config)
         
         self.data_exporter = DataExporter()
-        self.notifications = NotificationManager()
+        self.notifications = get_notification_manager()
         
         self.logger.info("Application initialized successfully")
     
@@ -97,7 +97,7 @@ class PDFKnowledgeExtractorApp:
             List of extraction results
         """
         results = []
-        output_dir = Path(self.config_manager.get('output_dir')).expanduser()
+        output_dir = self.config_manager.output_dir
         output_dir.mkdir(parents=True, exist_ok=True)
         
         formats = self.config_manager.get('supported_formats', ['excel', 'markdown'])
@@ -110,7 +110,7 @@ class PDFKnowledgeExtractorApp:
                 self.notifications.send_progress(i + 1, len(file_paths), "PDF Analysis")
                 
                 # Extract text and images
-                text, images = self.pdf_extractor.extract(file_path)
+                text, images = self.pdf_extractor.extract(file_path, max_images=self.config_manager.max_images)
                 
                 # Analyze with AI
                 analysis_result = self.ai_analyzer.analyze(text, images)
@@ -169,7 +169,7 @@ class PDFKnowledgeExtractorApp:
         """Run the application with GUI."""
         self.logger.info("Starting GUI mode")
         
-        output_dir = Path(self.config_manager.get('output_dir')).expanduser()
+        output_dir = self.config_manager.output_dir
         formats = self.config_manager.get('supported_formats', ['excel', 'markdown'])
         
         import tkinter as tk
@@ -212,6 +212,7 @@ class PDFKnowledgeExtractorApp:
         """Clean up temporary resources."""
         try:
             self.pdf_extractor.cleanup()
+            self.notifications.shutdown()
             self.logger.info("Cleanup completed")
         except Exception as e:
             self.logger.warning(f"Error during cleanup: {e}")
@@ -6,31 +6,27 @@ Extracts knowledge from PDF files with multiple extraction modes
 
 import os
 import sys
+import re
+import copy
 import json
+import functools
 import argparse
+import atexit
+import queue
 import tempfile
 import shutil
-import __main__
 import threading
-import tkinter as tk
-from tkinter import messagebox, ttk, filedialog
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing import Queue as ProcessQueue, freeze_support
+from multiprocessing.util import Finalize
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
-import pandas as pd
-from pdf2image import convert_from_path
-from PIL import Image
 import fitz  # PyMuPDF
-from pptx import Presentation
 import google.generativeai as genai
-from tqdm import tqdm
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment
-from openpyxl.utils.dataframe import dataframe_to_rows
-import yaml
 from pathvalidate import sanitize_filename
 
 # Import our custom modules
@@ -49,25 +45,160 @@ if sys.platform == "darwin":
 os.environ['TK_SILENCE_DEPRECATION'] = '1'
 if sys.platform == 'darwin':
     os.environ['PYTHON_CONFIGURE_OPTS'] = '--enable-framework'
-    # Try to use system Tkinter
-    try:
-        tk._test()
-    except Exception as e:
-        print(f"Tkinter test failed: {e}")
-        # Fallback to alternative display
-        os.environ['DISPLAY'] = ':0'
+
+# Default location for config, logs and results
+_DEFAULT_OUTPUT_DIR = Path.home() / "Desktop" / "PDF knowledge extractor"
+
+# Knowledge categories requested from Gemini, in prompt order
+_CATEGORIES = (
+    "概念・理論",
+    "方法論・手順",
+    "事例・ケーススタディ",
+    "データ・数値",
+    "注意点・リスク",
+    "ベストプラクティス",
+)
+# Normalized "N. category" header -> category, so a header is one dict probe
+_HEADER_LOOKUP = {f"{i}. {category}": category for i, category in enumerate(_CATEGORIES, 1)}
+
+# Matches numbered category headers such as "1. 概念・理論" or "**1. 概念・理論**"
+_HEADER_RE = re.compile(r"^[#*\s]*(\d)\.\s*([^\s*:：]+)")
+
+# Buffer size for large sequential writes (YAML output); matches
+# the 256 KiB that shutil.COPY_BUFSIZE settled on for modern storage
+_WRITE_BUFSIZE = 1 << 18
+
+# Heavy output/conversion libraries are imported on first use so that
+# processes which never write those formats don't pay for them at startup
+@functools.lru_cache(maxsize=None)
+def _load_openpyxl():
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill
+    return Workbook, WriteOnlyCell, Font, PatternFill
+
+@functools.lru_cache(maxsize=None)
+def _load_pptx():
+    from pptx import Presentation
+    return Presentation
+
+@functools.lru_cache(maxsize=None)
+def _load_pdf2image():
+    from pdf2image import convert_from_path
+    return convert_from_path
+
+@functools.lru_cache(maxsize=None)
+def _load_yaml():
+    import yaml
+    # libyaml's C emitter is several times faster; it is absent when PyYAML
+    # was built without libyaml, so fall back to the pure-Python SafeDumper
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml, dumper
+
+@functools.lru_cache(maxsize=None)
+def _load_tkinter():
+    # Tk/Tcl start-up dominates cold start, and CLI runs never open a window
+    import tkinter as tk
+    from tkinter import messagebox, ttk, filedialog  # noqa: F401 - bound as tk.<name>
+    if sys.platform == 'darwin':
+        # Try to use system Tkinter
+        try:
+            tk._test()
+        except Exception as e:
+            print(f"Tkinter test failed: {e}")
+            # Fallback to alternative display
+            os.environ['DISPLAY'] = ':0'
+    return tk
+
+@functools.lru_cache(maxsize=4096)
+def _sanitize(stem: str) -> str:
+    """Cached sanitize_filename; the rules are fixed for the life of the process."""
+    return sanitize_filename(stem)
+
+def _fast_rmtree(path: Path):
+    """Remove a directory tree, using ``rm -rf`` on POSIX where it beats shutil.rmtree."""
+    if sys.platform != 'win32':
+        import subprocess
+        try:
+            subprocess.run(['rm', '-rf', str(path)], check=False)
+        except OSError:
+            pass
+    if path.exists():
+        # Windows, or rm was unavailable/failed
+        shutil.rmtree(path, ignore_errors=True)
+
+def _iter_pdfs(directory: Path):
+    """Yield the PDF files directly inside directory, without sorting or globbing."""
+    with os.scandir(directory) as it:
+        for entry in it:
+            # Skip dotfiles like glob("*.pdf") did (e.g. macOS "._" resource forks)
+            if entry.name.startswith('.') or not entry.name.lower().endswith('.pdf'):
+                continue
+            if entry.is_file():
+                yield Path(entry.path)
+
+_ANALYSIS_PROMPT = """
+あなたは専門的な文書分析エキスパートです。提供された文書から重要な知見を抽出し、以下の6つのカテゴリーに分類してください：
+
+1. 概念・理論: 基本的な概念、理論、原理
+2. 方法論・手順: 具体的な方法、手順、プロセス
+3. 事例・ケーススタディ: 実例、事例研究、応用例
+4. データ・数値: 統計データ、数値、測定結果
+5. 注意点・リスク: 警告、注意事項、リスク要因
+6. ベストプラクティス: 推奨事項、成功事例、最適解
+
+各カテゴリーについて、以下の形式で回答してください：
+
+1. 概念・理論
+- 項目1: 説明
+- 項目2: 説明
+
+2. 方法論・手順
+- 項目1: 説明
+- 項目2: 説明
+
+（以下同様）
+
+重要なポイント：
+- 各カテゴリーで最低1つ、最大5つの項目を抽出
+- 簡潔で分かりやすい説明を心がける
+- 文書の内容に忠実に
+- 日本語で回答する
+"""
 
 class PDFKnowledgeExtractor:
     """Main class for extracting knowledge from PDF documents."""
     
-    def __init__(self, config_path: str = "config.json"):
-        """Initialize the extractor with configuration."""
+    # Directories already created in this process
+    _dirs_ready: Set[Path] = set()
+    
+    def __init__(self, config_path: str = "config.json", worker: bool = False, enable_ai: bool = True):
+        """Initialize the extractor with configuration.
+        
+        Args:
+            config_path: Path to configuration file
+            worker: Running in a pool worker; logging is set up by the caller
+                and notifications are left to the parent process
+            enable_ai: Whether to set up the Gemini client and AI analyzer
+        """
+        self.config_path = config_path
         self.config = self._load_config(config_path)
-        self.setup_logging()
+        
+        if worker:
+            logging.getLogger().setLevel(getattr(logging, self.config.get("log_level", "INFO")))
+            self._notif_thread = None
+        else:
+            self.setup_logging()
+            
+            # Notifications are delivered by a background thread so the
+            # processing path never blocks on the notification center
+            self._notif_q = queue.SimpleQueue()
+            self._notif_thread = threading.Thread(target=self._notif_worker, daemon=True)
+            self._notif_thread.start()
         
         # Initialize Gemini client only if API key is provided and not in raw text mode
         self.gemini_client = None
-        if self.config.get("gemini_api_key") and self.config.get("extraction_settings", {}).get("default_mode") != "raw_text_only":
+        if enable_ai and self.config.get("gemini_api_key") and self.config.get("extraction_settings", {}).get("default_mode") != "raw_text_only":
             try:
                 genai.configure(api_key=self.config["gemini_api_key"])
                 self.gemini_client = genai.GenerativeModel(self.config["model_name"])
@@ -78,9 +209,27 @@ class PDFKnowledgeExtractor:
         else:
             logging.info("No API key provided or raw text mode selected - AI analysis disabled")
         
-        self.temp_dir = Path(tempfile.mkdtemp(prefix="pdf_extractor_"))
+        # TemporaryDirectory removes itself when the extractor is garbage
+        # collected, so the directory is not leaked if cleanup() is never called
+        self._tmp = tempfile.TemporaryDirectory(prefix="pdf_extractor_")
+        self.temp_dir = Path(self._tmp.name)
         self.results = []
         
+        # Output writers by format; they share no state, so save_results runs them in parallel
+        self._writers = {
+            "json": self._save_json,
+            "excel": self._save_excel,
+            "yaml": self._save_yaml,
+            "powerpoint": self._save_powerpoint,
+            "markdown": self._save_markdown
+        }
+        self._raw_writers = {
+            "json": self._save_raw_json,
+            "txt": self._save_raw_txt,
+            "markdown": self._save_raw_markdown,
+            "yaml": self._save_raw_yaml
+        }
+        
         # Initialize core components
         self.extractor = PDFExtractor(self.temp_dir)
         
@@ -88,7 +237,6 @@ class PDFKnowledgeExtractor:
         self.analyzer = None
         if self.gemini_client:
             try:
-                from core.analyzer import AIAnalyzer
                 self.analyzer = AIAnalyzer(self.config)
                 logging.info("AI Analyzer initialized successfully")
             except Exception as e:
@@ -97,31 +245,44 @@ class PDFKnowledgeExtractor:
             logging.info("AI Analyzer disabled - no Gemini client available")
         
         self.output_dir = Path(self.config["output"]["output_directory"])
-        self.output_dir.mkdir(exist_ok=True)
+        self._ensure_dir(self.output_dir)
         
         logging.info("PDF Knowledge Extractor initialized successfully")
         
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _resolve_config_path(config_path: str, cwd: str) -> Optional[Path]:
+        """Locate the config file, checking each known location once per process.
+        
+        The working directory is part of the cache key, and the result is
+        absolute, so a later chdir cannot turn a cached hit into a stale path.
+        """
+        # Try multiple possible config file locations
+        possible_paths = [
+            Path(cwd) / config_path,
+            Path(__file__).parent / config_path,
+            Path(__file__).parent.parent / config_path,
+            _DEFAULT_OUTPUT_DIR / config_path,
+            # For PyInstaller bundled app
+            Path(sys._MEIPASS) / config_path if hasattr(sys, '_MEIPASS') else None
+        ]
+        
+        for path in possible_paths:
+            if path is not None and path.exists():
+                return path.resolve()
+        return None
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _read_config(config_file: str, mtime: float) -> Dict[str, Any]:
+        """Parse a config file; cached per (path, mtime) so edits are picked up."""
+        with open(config_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from JSON file."""
         try:
-            # Try multiple possible config file locations
-            possible_paths = [
-                config_path,
-                Path(__file__).parent / config_path,
-                Path(__file__).parent.parent / config_path,
-                Path.home() / "Desktop" / "PDF knowledge extractor" / config_path,
-                # For PyInstaller bundled app
-                Path(sys._MEIPASS) / config_path if hasattr(sys, '_MEIPASS') else None
-            ]
-            
-            # Filter out None values
-            possible_paths = [p for p in possible_paths if p is not None]
-            
-            config_file = None
-            for path in possible_paths:
-                if Path(path).exists():
-                    config_file = path
-                    break
+            config_file = self._resolve_config_path(str(config_path), os.getcwd())
             
             if config_file is None:
                 # Create default config if none exists
@@ -137,7 +298,7 @@ class PDFKnowledgeExtractor:
                     },
                     "output": {
                         "default_formats": ["json", "txt", "markdown"],
-                        "output_directory": str(Path.home() / "Desktop" / "PDF knowledge extractor")
+                        "output_directory": str(_DEFAULT_OUTPUT_DIR)
                     },
                     "extraction_settings": {
                         "default_mode": "raw_text_only",
@@ -152,17 +313,17 @@ class PDFKnowledgeExtractor:
                 }
                 
                 # Save default config to user's desktop
-                output_dir = Path.home() / "Desktop" / "PDF knowledge extractor"
-                output_dir.mkdir(exist_ok=True)
-                config_file = output_dir / "config.json"
+                self._ensure_dir(_DEFAULT_OUTPUT_DIR)
+                config_file = _DEFAULT_OUTPUT_DIR / "config.json"
                 
                 with open(config_file, 'w', encoding='utf-8') as f:
                     json.dump(default_config, f, ensure_ascii=False, indent=4)
                 
+                # The new file may now be discoverable; drop the cached miss
+                self._resolve_config_path.cache_clear()
                 logging.info(f"Created default config file: {config_file}")
             
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            config = copy.deepcopy(self._read_config(str(config_file), os.path.getmtime(config_file)))
                 
             logging.info(f"Loaded config from: {config_file}")
             return config
@@ -178,14 +339,21 @@ class PDFKnowledgeExtractor:
                 "log_level": "INFO",
                 "output": {
                     "default_formats": ["json", "txt", "markdown"],
-                    "output_directory": str(Path.home() / "Desktop" / "PDF knowledge extractor")
+                    "output_directory": str(_DEFAULT_OUTPUT_DIR)
                 }
             }
     
+    @classmethod
+    def _ensure_dir(cls, path: Path):
+        """Create a directory once per process; later calls skip the mkdir."""
+        if path not in cls._dirs_ready:
+            path.mkdir(parents=True, exist_ok=True)
+            cls._dirs_ready.add(path)
+    
     def setup_logging(self):
         """Setup logging configuration."""
-        log_dir = Path.home() / "Desktop" / "PDF knowledge extractor"
-        log_dir.mkdir(exist_ok=True)
+        log_dir = _DEFAULT_OUTPUT_DIR
+        self._ensure_dir(log_dir)
         log_file = log_dir / "extraction.log"
         
         logging.basicConfig(
@@ -250,7 +418,7 @@ class PDFKnowledgeExtractor:
             
             # Save results
             self.send_notification("PDF Knowledge Extractor", f"結果を保存中... ({', '.join(formats)})")
-            output_path = output_dir / sanitize_filename(file_path.stem)
+            output_path = output_dir / _sanitize(file_path.stem)
             self.save_results(results, output_path, formats)
             
             # Send completion notification
@@ -309,7 +477,7 @@ class PDFKnowledgeExtractor:
             
             # Save results
             self.send_notification("PDF Knowledge Extractor", f"結果を保存中... ({', '.join(formats)})")
-            output_path = output_dir / sanitize_filename(file_path.stem)
+            output_path = output_dir / _sanitize(file_path.stem)
             self.save_results(results, output_path, formats)
             
             # Send completion notification
@@ -351,12 +519,12 @@ class PDFKnowledgeExtractor:
                 'extraction_method': 'raw_text_only',
                 'total_pages': raw_text_data['total_pages'],
                 'total_characters': len(raw_text_data['full_text']),
-                'total_blocks': sum(len(page['blocks']) for page in raw_text_data['pages'])
+                'total_blocks': raw_text_data.get('total_blocks', 0)
             }
             
             # Save results
             self.send_notification("PDF Knowledge Extractor", f"結果を保存中... ({', '.join(formats)})")
-            output_path = output_dir / sanitize_filename(file_path.stem)
+            output_path = output_dir / _sanitize(file_path.stem)
             self.save_raw_results(raw_text_data, output_path, formats)
             
             # Send completion notification
@@ -372,13 +540,9 @@ class PDFKnowledgeExtractor:
     def extract_text_from_pdf(self, pdf_path: Path) -> str:
         """Extract text from PDF using PyMuPDF."""
         try:
-            doc = fitz.open(pdf_path)
-            text = ""
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                text += page.get_text()
-            doc.close()
-            return text
+            # Iterate pages directly; the context manager closes the document on error too
+            with fitz.open(pdf_path) as doc:
+                return "".join(page.get_text("text") for page in doc)
         except Exception as e:
             logging.error(f"Error extracting text from {pdf_path}: {e}")
             raise
@@ -386,11 +550,18 @@ class PDFKnowledgeExtractor:
     def convert_pdf_to_images(self, pdf_path: Path) -> List[Path]:
         """Convert PDF pages to images."""
         try:
+            convert_from_path = _load_pdf2image()
             images = convert_from_path(pdf_path, dpi=200)
             image_paths = []
             
+            # One subdirectory per PDF so files processed in the same
+            # extractor never overwrite each other's page images
+            image_dir = self.temp_dir / pdf_path.stem
+            shutil.rmtree(image_dir, ignore_errors=True)
+            image_dir.mkdir()
+            
             for i, image in enumerate(images):
-                image_path = self.temp_dir / f"page_{i+1}.png"
+                image_path = image_dir / f"page_{i+1}.png"
                 image.save(image_path, 'PNG')
                 image_paths.append(image_path)
                 
@@ -411,10 +582,11 @@ class PDFKnowledgeExtractor:
             if text.strip():
                 content.append(f"Document Text:\n{text}")
             
-            # Add images
-            for image_path in images[:10]:  # Limit to first 10 images
-                if image_path.exists():
-                    content.append(Image.open(image_path))
+            # Add images as raw PNG bytes so they are uploaded without a decode/re-encode.
+            # The paths come from convert_pdf_to_images, so they are known to exist.
+            max_images = self.config.get("pdf_processing", {}).get("max_images", 10)
+            for image_path in images[:max_images]:
+                content.append({"mime_type": "image/png", "data": image_path.read_bytes()})
             
             response = self.gemini_client.generate_content(content)
             return self._parse_gemini_response(response.text)
@@ -425,45 +597,11 @@ class PDFKnowledgeExtractor:
     
     def _build_analysis_prompt(self) -> str:
         """Build the analysis prompt for Gemini."""
-        return """
-あなたは専門的な文書分析エキスパートです。提供された文書から重要な知見を抽出し、以下の6つのカテゴリーに分類してください：
-
-1. 概念・理論: 基本的な概念、理論、原理
-2. 方法論・手順: 具体的な方法、手順、プロセス
-3. 事例・ケーススタディ: 実例、事例研究、応用例
-4. データ・数値: 統計データ、数値、測定結果
-5. 注意点・リスク: 警告、注意事項、リスク要因
-6. ベストプラクティス: 推奨事項、成功事例、最適解
-
-各カテゴリーについて、以下の形式で回答してください：
-
-1. 概念・理論
-- 項目1: 説明
-- 項目2: 説明
-
-2. 方法論・手順
-- 項目1: 説明
-- 項目2: 説明
-
-（以下同様）
-
-重要なポイント：
-- 各カテゴリーで最低1つ、最大5つの項目を抽出
-- 簡潔で分かりやすい説明を心がける
-- 文書の内容に忠実に
-- 日本語で回答する
-"""
+        return _ANALYSIS_PROMPT
     
     def _parse_gemini_response(self, response_text: str) -> Dict[str, Any]:
         """Parse Gemini AI response into structured data."""
-        categories = {
-            "概念・理論": [],
-            "方法論・手順": [],
-            "事例・ケーススタディ": [],
-            "データ・数値": [],
-            "注意点・リスク": [],
-            "ベストプラクティス": []
-        }
+        categories = {category: [] for category in _CATEGORIES}
         
         current_category = None
         lines = response_text.split('\n')
@@ -474,10 +612,12 @@ class PDFKnowledgeExtractor:
                 continue
                 
             # Check for category headers
-            for i, category in enumerate(categories.keys(), 1):
-                if f"{i}. {category}" in line or f"**{i}. {category}**" in line:
+            match = _HEADER_RE.match(line)
+            if match:
+                category = _HEADER_LOOKUP.get(f"{match.group(1)}. {match.group(2)}")
+                if category:
                     current_category = category
-                    break
+                    continue
             
             # Extract items
             if current_category and line.startswith('- '):
@@ -489,22 +629,42 @@ class PDFKnowledgeExtractor:
     
     def save_results(self, results: Dict[str, Any], output_path: Path, formats: List[str]):
         """Save results in specified formats."""
-        for format_type in formats:
-            try:
-                if format_type == "json":
-                    self._save_json(results, output_path)
-                elif format_type == "excel":
-                    self._save_excel(results, output_path)
-                elif format_type == "yaml":
-                    self._save_yaml(results, output_path)
-                elif format_type == "powerpoint":
-                    self._save_powerpoint(results, output_path)
-                elif format_type == "markdown":
-                    self._save_markdown(results, output_path)
-                else:
-                    logging.warning(f"Unknown format: {format_type}")
-            except Exception as e:
-                logging.error(f"Error saving {format_type} format: {e}")
+        jobs = []
+        for format_type in dict.fromkeys(formats):
+            writer = self._writers.get(format_type)
+            if writer:
+                jobs.append((format_type, writer))
+            else:
+                logging.warning(f"Unknown format: {format_type}")
+        self._run_writers(jobs, results, output_path)
+    
+    def _run_writers(self, jobs: List[Tuple[str, Any]], data: Dict[str, Any], output_path: Path):
+        """Run independent format writers concurrently, logging per-format failures."""
+        if not jobs:
+            return
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = {
+                executor.submit(self._write_output, writer, data, output_path): format_type
+                for format_type, writer in jobs
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logging.error(f"Error saving {futures[future]} format: {e}")
+    
+    @staticmethod
+    def _write_output(writer, data: Dict[str, Any], output_path: Path):
+        """Run one format writer, recreating the output directory if it has vanished.
+        
+        _ensure_dir only creates a directory once per process, so one that the
+        user deleted or moved during a long GUI session is recreated here.
+        """
+        try:
+            writer(data, output_path)
+        except FileNotFoundError:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            writer(data, output_path)
     
     def _save_json(self, results: Dict[str, Any], output_path: Path):
         """Save results as JSON."""
@@ -516,11 +676,12 @@ class PDFKnowledgeExtractor:
     def _save_excel(self, results: Dict[str, Any], output_path: Path):
         """Save results as Excel file."""
         excel_path = output_path.with_suffix('.xlsx')
+        Workbook, WriteOnlyCell, Font, PatternFill = _load_openpyxl()
         
-        wb = Workbook()
-        
-        # Remove default sheet
-        wb.remove(wb.active)
+        # Write-only mode streams rows to disk instead of building a cell grid
+        wb = Workbook(write_only=True)
+        header_font = Font(bold=True)
+        header_fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
         
         # Create sheets for each category
         for category, items in results.items():
@@ -529,32 +690,31 @@ class PDFKnowledgeExtractor:
                 
             ws = wb.create_sheet(title=category[:31])  # Excel sheet name limit
             
-            # Add headers
-            ws['A1'] = "項目"
-            ws['B1'] = "説明"
+            # Build rows and track column widths in the same pass
+            rows = []
+            col_widths = [len("項目"), len("説明")]
+            for i, item in enumerate(items, 1):
+                label = f"項目{i}"
+                rows.append([label, item])
+                col_widths[0] = max(col_widths[0], len(label))
+                col_widths[1] = max(col_widths[1], len(str(item)))
             
-            # Style headers
-            for cell in ws[1]:
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+            # Column widths must be set before the first row in write-only mode
+            ws.column_dimensions['A'].width = min(col_widths[0] + 2, 50)
+            ws.column_dimensions['B'].width = min(col_widths[1] + 2, 50)
             
-            # Add data
-            for i, item in enumerate(items, 2):
-                ws[f'A{i}'] = f"項目{i-1}"
-                ws[f'B{i}'] = item
+            # Add styled headers
+            headers = []
+            for value in ("項目", "説明"):
+                cell = WriteOnlyCell(ws, value=value)
+                cell.font = header_font
+                cell.fill = header_fill
+                headers.append(cell)
+            ws.append(headers)
             
-            # Auto-adjust column widths
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
+            # Add data
+            for row in rows:
+                ws.append(row)
         
         wb.save(excel_path)
         logging.info(f"Saved Excel: {excel_path}")
@@ -562,14 +722,16 @@ class PDFKnowledgeExtractor:
     def _save_yaml(self, results: Dict[str, Any], output_path: Path):
         """Save results as YAML."""
         yaml_path = output_path.with_suffix('.yaml')
-        with open(yaml_path, 'w', encoding='utf-8') as f:
-            yaml.dump(results, f, default_flow_style=False, allow_unicode=True)
+        yaml, dumper = _load_yaml()
+        with open(yaml_path, 'w', encoding='utf-8', buffering=_WRITE_BUFSIZE) as f:
+            yaml.dump(results, f, Dumper=dumper, default_flow_style=False, allow_unicode=True)
         logging.info(f"Saved YAML: {yaml_path}")
     
     def _save_powerpoint(self, results: Dict[str, Any], output_path: Path):
         """Save results as PowerPoint presentation."""
         pptx_path = output_path.with_suffix('.pptx')
         
+        Presentation = _load_pptx()
         prs = Presentation()
         
         # Title slide
@@ -631,26 +793,36 @@ class PDFKnowledgeExtractor:
     
     def save_raw_results(self, raw_data: Dict[str, Any], output_path: Path, formats: List[str]):
         """Save raw text results in specified formats."""
-        for format_type in formats:
-            try:
-                if format_type == "json":
-                    self._save_raw_json(raw_data, output_path)
-                elif format_type == "txt":
-                    self._save_raw_txt(raw_data, output_path)
-                elif format_type == "markdown":
-                    self._save_raw_markdown(raw_data, output_path)
-                elif format_type == "yaml":
-                    self._save_raw_yaml(raw_data, output_path)
-                else:
-                    logging.warning(f"Unknown format for raw extraction: {format_type}")
-            except Exception as e:
-                logging.error(f"Error saving {format_type} format: {e}")
+        jobs = []
+        for format_type in dict.fromkeys(formats):
+            writer = self._raw_writers.get(format_type)
+            if writer:
+                jobs.append((format_type, writer))
+            else:
+                logging.warning(f"Unknown format for raw extraction: {format_type}")
+        self._run_writers(jobs, raw_data, output_path)
     
     def _save_raw_json(self, raw_data: Dict[str, Any], output_path: Path):
-        """Save raw text data as JSON."""
+        """Save raw text data as JSON, encoding one page at a time."""
         json_path = output_path.with_suffix('.raw.json')
         with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(raw_data, f, ensure_ascii=False, indent=2)
+            f.write("{\n")
+            for i, (key, value) in enumerate(raw_data.items()):
+                if i:
+                    f.write(",\n")
+                f.write(f"  {json.dumps(key, ensure_ascii=False)}: ")
+                if key == 'pages':
+                    # Pages hold every block's text, font and position; encode
+                    # them individually so only one page is serialized at a time
+                    f.write("[\n")
+                    for j, page in enumerate(value):
+                        if j:
+                            f.write(",\n")
+                        f.write("    " + json.dumps(page, ensure_ascii=False))
+                    f.write("\n  ]")
+                else:
+                    f.write(json.dumps(value, ensure_ascii=False))
+            f.write("\n}\n")
         logging.info(f"Saved raw JSON: {json_path}")
     
     def _save_raw_txt(self, raw_data: Dict[str, Any], output_path: Path):
@@ -660,7 +832,7 @@ class PDFKnowledgeExtractor:
             f.write(f"=== PDF Raw Text Extraction ===\n")
             f.write(f"File: {raw_data['file_name']}\n")
             f.write(f"Pages: {raw_data['total_pages']}\n")
-            f.write(f"Characters: {len(raw_data['full_text'])}\n")
+            f.write(f"Characters: {raw_data['metadata']['total_characters']}\n")
             f.write(f"Extracted: {raw_data['extraction_timestamp']}\n")
             f.write("=" * 50 + "\n\n")
             
@@ -678,7 +850,7 @@ class PDFKnowledgeExtractor:
             f.write("# PDF Raw Text Extraction\n\n")
             f.write(f"**File:** {raw_data['file_name']}\n")
             f.write(f"**Pages:** {raw_data['total_pages']}\n")
-            f.write(f"**Characters:** {len(raw_data['full_text'])}\n")
+            f.write(f"**Characters:** {raw_data['metadata']['total_characters']}\n")
             f.write(f"**Extracted:** {raw_data['extraction_timestamp']}\n\n")
             
             for page in raw_data['pages']:
@@ -710,13 +882,45 @@ class PDFKnowledgeExtractor:
         logging.info(f"Saved raw Markdown: {md_path}")
     
     def _save_raw_yaml(self, raw_data: Dict[str, Any], output_path: Path):
-        """Save raw text data as YAML."""
+        """Save raw text data as YAML, emitting one page at a time."""
         yaml_path = output_path.with_suffix('.raw.yaml')
-        with open(yaml_path, 'w', encoding='utf-8') as f:
-            yaml.dump(raw_data, f, default_flow_style=False, allow_unicode=True)
+        yaml, dumper = _load_yaml()
+        with open(yaml_path, 'w', encoding='utf-8', buffering=_WRITE_BUFSIZE) as f:
+            header = {key: value for key, value in raw_data.items() if key != 'pages'}
+            yaml.dump(header, f, Dumper=dumper, default_flow_style=False, allow_unicode=True)
+            
+            # Each page is emitted as a one-item block sequence under "pages:",
+            # which keeps a single YAML document without serializing every page at once
+            pages = raw_data.get('pages', [])
+            if not pages:
+                f.write("pages: []\n")
+            else:
+                f.write("pages:\n")
+                for page in pages:
+                    yaml.dump([page], f, Dumper=dumper, default_flow_style=False, allow_unicode=True)
         logging.info(f"Saved raw YAML: {yaml_path}")
     
     def send_notification(self, title: str, message: str):
+        """Queue a system notification for background delivery."""
+        if self._notif_thread is not None:
+            self._notif_q.put_nowait((title, message))
+    
+    def _notif_worker(self):
+        """Deliver queued notifications, skipping back-to-back duplicates."""
+        last_sent = None
+        while True:
+            item = self._notif_q.get()
+            if item is None:
+                break
+            if item == last_sent:
+                continue
+            try:
+                self._deliver_notification(*item)
+            except Exception as e:
+                logging.warning(f"Failed to deliver notification: {e}")
+            last_sent = item
+    
+    def _deliver_notification(self, title: str, message: str):
         """Send system notification."""
         if sys.platform == "darwin" and NSUserNotification:
             notification = NSUserNotification.alloc().init()
@@ -728,21 +932,79 @@ class PDFKnowledgeExtractor:
     
     def cleanup(self):
         """Clean up temporary files."""
+        # Flush pending notifications before tearing down
+        if self._notif_thread is not None:
+            self._notif_q.put_nowait(None)
+            self._notif_thread.join(timeout=5)
+        
         if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+            _fast_rmtree(self.temp_dir)
+            # Directory is gone; this only detaches the TemporaryDirectory finalizer
+            self._tmp.cleanup()
             logging.info(f"Cleaned up temporary directory: {self.temp_dir}")
         
         # Clean up extractor
         self.extractor.cleanup()
 
+# Extractor owned by a ProcessPoolExecutor worker process
+_worker_extractor: Optional[PDFKnowledgeExtractor] = None
+
+def _worker_init(config_path: str, method_name: str, log_queue: ProcessQueue):
+    """Build this worker process's extractor from the parent's config file.
+    
+    Log records are forwarded to the parent through log_queue so only the
+    parent writes the log files.
+    """
+    global _worker_extractor
+    root = logging.getLogger()
+    # Forked workers inherit the parent's file handlers; drop them
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    
+    # Raw text extraction never calls Gemini
+    _worker_extractor = PDFKnowledgeExtractor(
+        config_path, worker=True, enable_ai=method_name != "process_file_raw_extraction"
+    )
+    # Runs at worker shutdown under both fork and spawn, unlike atexit
+    Finalize(_worker_extractor, _worker_extractor.cleanup, exitpriority=10)
+
+def _worker_process(method_name: str, file_path: Path, output_dir: Path, formats: List[str]):
+    """Run one process_file* method in a worker process.
+    
+    The results are already written to disk by the worker, so they are not
+    pickled back to the parent.
+    """
+    getattr(_worker_extractor, method_name)(file_path, output_dir, formats)
+
 class PDFExtractorGUI:
+    # Worker threads never touch Tk directly; they post (event, payload)
+    # tuples that the Tk thread applies in batches on this interval
+    UI_POLL_INTERVAL_MS = 50
+    UI_MAX_EVENTS_PER_TICK = 100
+    
+    # CPU-bound modes run in worker processes so PDFs parse in parallel
+    # despite the GIL; standard mode mostly waits on Gemini and stays threaded
+    PROCESS_POOL_METHODS = {
+        "detailed": "process_file_detailed",
+        "raw_text_only": "process_file_raw_extraction"
+    }
+    
     def __init__(self, extractor: PDFKnowledgeExtractor):
         """Initialize the GUI."""
         self.extractor = extractor
         self.output_dir = Path("/Users/hideki/Desktop/PDF knowledge extractor")
         self.formats = ["json", "excel", "markdown"]
         
+        # Extraction mode (radiobutton value) -> processing method
+        self._mode_methods = {
+            "detailed": extractor.process_file_detailed,
+            "raw_text_only": extractor.process_file_raw_extraction,
+            "standard": extractor.process_file
+        }
+        
         # Create main window with minimal setup
+        tk = _load_tkinter()
         self.root = tk.Tk()
         self.root.title("PDF Knowledge Extractor - Enhanced")
         self.root.geometry("600x500")
@@ -758,13 +1020,19 @@ class PDFExtractorGUI:
         
         # Protocol handler
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        
+        # UI event queue fed by the worker thread
+        self._ui_queue = queue.SimpleQueue()
+        self._drain_job = self.root.after(self.UI_POLL_INTERVAL_MS, self._drain_queue)
     
     def on_closing(self):
         """Handle window closing event."""
+        self.root.after_cancel(self._drain_job)
         self.root.quit()
         self.root.destroy()
         
     def setup_ui(self):
+        tk = _load_tkinter()
         # Title
         title_label = tk.Label(
             self.root, 
@@ -893,7 +1161,7 @@ class PDFExtractorGUI:
         )
         self.progress_label.pack(pady=5)
         
-        self.progress_bar = ttk.Progressbar(
+        self.progress_bar = tk.ttk.Progressbar(
             self.root,
             mode='indeterminate',
             length=300
@@ -919,53 +1187,128 @@ class PDFExtractorGUI:
         self.select_frame.bind("<Leave>", lambda e: self.select_frame.configure(bg="#ffffff"))
         
     def select_files(self, event=None):
-        files = filedialog.askopenfilenames(
+        files = _load_tkinter().filedialog.askopenfilenames(
             title="PDFファイルを選択",
             filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")]
         )
         if files:
             self.process_files(list(files))
     
+    def _post(self, event: str, payload: Any = None):
+        """Queue a UI update from a worker thread."""
+        self._ui_queue.put_nowait((event, payload))
+    
+    def _drain_queue(self):
+        """Apply queued UI updates on the Tk thread, then reschedule."""
+        status = None
+        for _ in range(self.UI_MAX_EVENTS_PER_TICK):
+            try:
+                event, payload = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            if event == "status":
+                # Only the latest status in a tick is worth drawing
+                status = payload
+                continue
+            
+            # Show pending status before anything that may block on a dialog
+            if status is not None:
+                self.progress_var.set(status)
+                status = None
+            
+            if event == "start":
+                self.progress_bar.start()
+            elif event == "stop":
+                self.progress_bar.stop()
+            elif event == "info":
+                _load_tkinter().messagebox.showinfo(*payload)
+            elif event == "error":
+                _load_tkinter().messagebox.showerror(*payload)
+            elif event == "reset":
+                self.root.after(payload, lambda: self.progress_var.set("待機中..."))
+        
+        if status is not None:
+            self.progress_var.set(status)
+        self._drain_job = self.root.after(self.UI_POLL_INTERVAL_MS, self._drain_queue)
+    
     def process_files(self, files):
+        # Read the Tk variable here on the Tk thread; worker threads must not call into Tcl
+        mode = self.extraction_mode.get()
+        # Resolve the processing method once per batch
+        method = self._mode_methods.get(mode, self.extractor.process_file)
+        
         def worker():
             try:
-                self.root.after(0, lambda: self.progress_var.set("処理中..."))
-                self.root.after(0, lambda: self.progress_bar.start())
+                self._post("status", "処理中...")
+                self._post("start")
                 
-                for file_path in files:
-                    file_path = Path(file_path)
-                    self.root.after(0, lambda f=file_path.name: self.progress_var.set(f"処理中: {f}"))
-                    
-                    # Choose processing method based on selected mode
-                    if self.extraction_mode.get() == "detailed":
-                        results = self.extractor.process_file_detailed(file_path, self.output_dir, self.formats)
-                    elif self.extraction_mode.get() == "raw_text_only":
-                        results = self.extractor.process_file_raw_extraction(file_path, self.output_dir, self.formats)
-                    else:
-                        results = self.extractor.process_file(file_path, self.output_dir, self.formats)
+                # Files are independent, so overlap their disk and Gemini API waits
+                paths = [Path(f) for f in files]
+                method_name = self.PROCESS_POOL_METHODS.get(mode)
+                log_listener = None
+                # A single file isn't worth the cost of starting worker processes
+                if method_name and len(paths) > 1:
+                    # Workers send their log records here to be written by this process's handlers
+                    log_queue = ProcessQueue()
+                    log_listener = QueueListener(log_queue, *logging.getLogger().handlers, respect_handler_level=True)
+                    log_listener.start()
+                    executor = ProcessPoolExecutor(
+                        max_workers=min(len(paths), os.cpu_count() or 1),
+                        initializer=_worker_init,
+                        initargs=(self.extractor.config_path, method_name, log_queue)
+                    )
+                    submit = lambda path: executor.submit(
+                        _worker_process, method_name, path, self.output_dir, self.formats
+                    )
+                else:
+                    max_workers = max(1, min(len(paths), int(self.extractor.config.get("max_workers", 4))))
+                    executor = ThreadPoolExecutor(max_workers=max_workers)
+                    submit = lambda path: executor.submit(method, path, self.output_dir, self.formats)
+                
+                failures = []
+                try:
+                    with executor:
+                        futures = {submit(path): path for path in paths}
+                        for done, future in enumerate(as_completed(futures), 1):
+                            file_path = futures[future]
+                            try:
+                                future.result()
+                            except Exception as e:
+                                logging.error(f"Failed to process {file_path}: {e}")
+                                failures.append((file_path.name, e))
+                            self._post("status", f"処理中: {done}/{len(paths)} ({file_path.name})")
+                finally:
+                    if log_listener is not None:
+                        # Workers have exited; write out any records still queued
+                        log_listener.stop()
+                
+                if failures:
+                    name, e = failures[0]
+                    raise RuntimeError(f"{len(failures)}/{len(paths)} ファイルの処理に失敗しました ({name}: {e})")
                     
-                self.root.after(0, lambda: self.progress_bar.stop())
-                self.root.after(0, lambda: self.progress_var.set("処理完了！"))
+                self._post("stop")
+                self._post("status", "処理完了！")
                 
                 # Show completion message
                 mode_text = {
                     "detailed": "詳細抽出",
                     "raw_text_only": "生テキスト抽出",
                     "standard": "標準抽出"
-                }.get(self.extraction_mode.get(), "標準抽出")
+                }.get(mode, "標準抽出")
                 
-                self.root.after(0, lambda: messagebox.showinfo(
+                self._post("info", (
                     "完了", 
                     f"処理が完了しました！\n\n抽出モード: {mode_text}\n出力先: {self.output_dir}\n\n生成ファイル: JSON, TXT, Markdown, YAML"
                 ))
                 
-                self.root.after(2000, lambda: self.progress_var.set("待機中..."))
+                self._post("reset", 2000)
                 
             except Exception as e:
-                self.root.after(0, lambda: self.progress_bar.stop())
-                self.root.after(0, lambda: self.progress_var.set("エラーが発生しました"))
-                self.root.after(0, lambda: messagebox.showerror("エラー", f"処理中にエラーが発生しました:\n{str(e)}"))
-                self.root.after(2000, lambda: self.progress_var.set("待機中..."))
+                self._post("stop")
+                self._post("status", "エラーが発生しました")
+                self._post("error", ("エラー", f"処理中にエラーが発生しました:\n{str(e)}"))
+                self._post("reset", 2000)
         
         # Run processing in separate thread
         thread = threading.Thread(target=worker, daemon=True)
@@ -981,12 +1324,22 @@ def main():
     debug_log_path = "/Users/hideki/Desktop/PDF knowledge extractor/debug.log"
     Path(debug_log_path).parent.mkdir(exist_ok=True)
     
-    with open(debug_log_path, "a", encoding="utf-8") as f:
-        f.write(f"\n=== App Started: {datetime.now()} ===\n")
-        f.write(f"Command line args: {sys.argv}\n")
-        f.write(f"Working directory: {os.getcwd()}\n")
-        f.write(f"Python version: {sys.version}\n")
-        f.write(f"Platform: {sys.platform}\n")
+    # Keep one handle open for the whole run instead of reopening per message
+    debug_log = open(debug_log_path, "a", encoding="utf-8")
+    atexit.register(debug_log.close)
+    
+    def dlog(*lines: str):
+        """Append lines to the debug log, flushing so they survive a crash."""
+        debug_log.writelines(lines)
+        debug_log.flush()
+    
+    dlog(
+        f"\n=== App Started: {datetime.now()} ===\n",
+        f"Command line args: {sys.argv}\n",
+        f"Working directory: {os.getcwd()}\n",
+        f"Python version: {sys.version}\n",
+        f"Platform: {sys.platform}\n"
+    )
     
     parser = argparse.ArgumentParser(description="Extract knowledge from PDF documents")
     parser.add_argument("input", nargs="?", help="Input PDF file or directory")
@@ -1000,7 +1353,7 @@ def main():
     if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
         script_dir = Path(sys._MEIPASS)
     else:
-        script_dir = Path(__file__).parent if hasattr(__main__, "__file__") else Path(sys.argv[0]).parent
+        script_dir = Path(__file__).parent if hasattr(sys.modules["__main__"], "__file__") else Path(sys.argv[0]).parent
     
     default_config = script_dir / "config.json"
     parser.add_argument("-c", "--config", default=str(default_config), help="Configuration file")
@@ -1008,26 +1361,26 @@ def main():
     args = parser.parse_args()
     
     # Log parsed arguments
-    with open(debug_log_path, "a", encoding="utf-8") as f:
-        f.write(f"Parsed input: {args.input}\n")
-        f.write(f"Output dir: {args.output}\n")
-        f.write(f"Formats: {args.format}\n")
-        f.write(f"Config path: {args.config}\n")
-        f.write(f"Config file exists: {Path(args.config).exists()}\n")
-        f.write(f"Is frozen: {getattr(sys, 'frozen', False)}\n")
+    dlog(
+        f"Parsed input: {args.input}\n",
+        f"Output dir: {args.output}\n",
+        f"Formats: {args.format}\n",
+        f"Config path: {args.config}\n",
+        f"Config file exists: {Path(args.config).exists()}\n",
+        f"Is frozen: {getattr(sys, 'frozen', False)}\n"
+    )
     
     # Initialize extractor
     try:
-        with open(debug_log_path, "a", encoding="utf-8") as f:
-            f.write("Initializing PDFKnowledgeExtractor...\n")
+        dlog("Initializing PDFKnowledgeExtractor...\n")
         extractor = PDFKnowledgeExtractor(args.config)
-        with open(debug_log_path, "a", encoding="utf-8") as f:
-            f.write("PDFKnowledgeExtractor initialized successfully\n")
+        dlog("PDFKnowledgeExtractor initialized successfully\n")
     except Exception as e:
-        with open(debug_log_path, "a", encoding="utf-8") as f:
-            f.write(f"Error initializing PDFKnowledgeExtractor: {e}\n")
-            import traceback
-            f.write(f"Traceback: {traceback.format_exc()}\n")
+        import traceback
+        dlog(
+            f"Error initializing PDFKnowledgeExtractor: {e}\n",
+            f"Traceback: {traceback.format_exc()}\n"
+        )
         
         # Show error dialog
         try:
@@ -1043,34 +1396,35 @@ def main():
         
         # Handle case where no input file is provided (e.g., from Finder right-click)
         if not args.input:
-            with open(debug_log_path, "a", encoding="utf-8") as f:
-                f.write("No input file provided - launching GUI mode\n")
+            dlog("No input file provided - launching GUI mode\n")
             
             # For macOS PyInstaller apps, we need to handle GUI differently
             if sys.platform == "darwin" and getattr(sys, 'frozen', False):
-                with open(debug_log_path, "a", encoding="utf-8") as f:
-                    f.write("Running on frozen macOS app - using file dialog directly\n")
+                dlog("Running on frozen macOS app - using file dialog directly\n")
                 
                 # Use file dialog directly
                 extractor.send_notification("PDF Knowledge Extractor", "PDFファイルを選択してください")
                 
-                import subprocess
                 try:
-                    # Use multiple file selection
-                    result = subprocess.run([
-                        'osascript', '-e',
-                        'tell application "System Events" to return POSIX path of (choose file with prompt "PDFファイルを選択してください:" of type {"pdf"} with multiple selections allowed)'
-                    ], capture_output=True, text=True, timeout=60)
+                    # In-process Tk dialog; avoids forking osascript just to pick files
+                    tk = _load_tkinter()
+                    dialog_root = tk.Tk()
+                    dialog_root.withdraw()
+                    try:
+                        selected_files = dialog_root.tk.splitlist(tk.filedialog.askopenfilenames(
+                            parent=dialog_root,
+                            title="PDFファイルを選択してください",
+                            filetypes=[("PDF files", "*.pdf")]
+                        ))
+                    finally:
+                        dialog_root.destroy()
                     
-                    if result.returncode == 0 and result.stdout.strip():
-                        # Parse selected files (AppleScript returns comma-separated list)
-                        selected_files = result.stdout.strip().split(", ")
-                        with open(debug_log_path, "a", encoding="utf-8") as f:
-                            f.write(f"User selected files: {selected_files}\n")
+                    if selected_files:
+                        dlog(f"User selected files: {selected_files}\n")
                         
                         # Process each file
                         for file_path in selected_files:
-                            file_path = Path(file_path.strip())
+                            file_path = Path(file_path)
                             if file_path.exists() and file_path.suffix.lower() == '.pdf':
                                 try:
                                     results = extractor.process_file(file_path, output_dir, args.format)
@@ -1082,37 +1436,28 @@ def main():
                         extractor.send_notification("PDF Knowledge Extractor", f"全ての処理が完了しました。\n出力先: {output_dir}")
                         return 0
                     else:
-                        with open(debug_log_path, "a", encoding="utf-8") as f:
-                            f.write("User cancelled file selection\n")
+                        dlog("User cancelled file selection\n")
                         extractor.send_notification("PDF Knowledge Extractor", "ファイル選択がキャンセルされました")
                         return 0
-                except subprocess.TimeoutExpired:
-                    with open(debug_log_path, "a", encoding="utf-8") as f:
-                        f.write("File dialog timed out\n")
-                    extractor.send_notification("PDF Knowledge Extractor", "ファイル選択がタイムアウトしました")
-                    return 0
                 except Exception as e2:
-                    with open(debug_log_path, "a", encoding="utf-8") as f:
-                        f.write(f"File dialog error: {e2}\n")
+                    dlog(f"File dialog error: {e2}\n")
                     extractor.send_notification("PDF Knowledge Extractor", f"ファイル選択エラー: {e2}")
                     return 1
             else:
                 # Try to launch GUI mode for non-frozen apps
                 try:
-                    with open(debug_log_path, "a", encoding="utf-8") as f:
-                        f.write("Creating GUI instance...\n")
+                    dlog("Creating GUI instance...\n")
                     gui = PDFExtractorGUI(extractor)
-                    with open(debug_log_path, "a", encoding="utf-8") as f:
-                        f.write("GUI instance created, starting mainloop...\n")
+                    dlog("GUI instance created, starting mainloop...\n")
                     gui.run()
-                    with open(debug_log_path, "a", encoding="utf-8") as f:
-                        f.write("GUI mainloop ended\n")
+                    dlog("GUI mainloop ended\n")
                     return 0
                 except Exception as e:
-                    with open(debug_log_path, "a", encoding="utf-8") as f:
-                        f.write(f"GUI launch error: {e}\n")
-                        import traceback
-                        f.write(f"Traceback: {traceback.format_exc()}\n")
+                    import traceback
+                    dlog(
+                        f"GUI launch error: {e}\n",
+                        f"Traceback: {traceback.format_exc()}\n"
+                    )
                     
                     # Show error and exit
                     try:
@@ -1125,10 +1470,11 @@ def main():
         # Process provided input path
         input_path = Path(args.input)
         
-        with open(debug_log_path, "a", encoding="utf-8") as f:
-            f.write(f"Processing input path: {input_path}\n")
-            f.write(f"Path exists: {input_path.exists()}\n")
-            f.write(f"Is file: {input_path.is_file()}\n")
+        dlog(
+            f"Processing input path: {input_path}\n",
+            f"Path exists: {input_path.exists()}\n",
+            f"Is file: {input_path.is_file()}\n"
+        )
         
         if input_path.is_file():
             # Process single file
@@ -1137,23 +1483,25 @@ def main():
             
         elif input_path.is_dir():
             # Process directory
-            pdf_files = list(input_path.glob("*.pdf"))
-            if not pdf_files:
-                logging.warning(f"No PDF files found in {input_path}")
-                return
-            
-            for pdf_file in tqdm(pdf_files, desc="Processing PDFs"):
+            from tqdm import tqdm
+            # Stream PDFs as they are found so work starts before the scan ends
+            processed = 0
+            for pdf_file in tqdm(_iter_pdfs(input_path), total=None, desc="Processing PDFs"):
+                processed += 1
                 try:
                     extractor.process_file(pdf_file, output_dir, args.format)
                 except Exception as e:
                     logging.error(f"Failed to process {pdf_file}: {e}")
                     continue
             
-            extractor.send_notification("PDF Knowledge Extractor", f"Processed {len(pdf_files)} files")
+            if not processed:
+                logging.warning(f"No PDF files found in {input_path}")
+                return
+            
+            extractor.send_notification("PDF Knowledge Extractor", f"Processed {processed} files")
         
         else:
-            with open(debug_log_path, "a", encoding="utf-8") as f:
-                f.write(f"Input path does not exist: {input_path}\n")
+            dlog(f"Input path does not exist: {input_path}\n")
             logging.error(f"Input path does not exist: {input_path}")
             extractor.send_notification("PDF Knowledge Extractor", f"ファイルが見つかりません: {input_path}")
             return
@@ -1169,4 +1517,6 @@ def main():
     return 0
 
 if __name__ == "__main__":
+    # Required for ProcessPoolExecutor workers in the frozen app bundle
+    freeze_support()
     sys.exit(main())
\ No newline at end of file
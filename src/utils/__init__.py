@@ -7,6 +7,6 @@ logging, and notifications.
 
 from utils.config_manager import ConfigManager
 from utils.logger import setup_logger
-from utils.notifications import NotificationManager
+from utils.notifications import NotificationManager, get_notification_manager
 
-__all__ = ['ConfigManager', 'setup_logger', 'NotificationManager']
\ No newline at end of file
+__all__ = ['ConfigManager', 'setup_logger', 'NotificationManager', 'get_notification_manager']
\ No newline at end of file
@@ -2,30 +2,58 @@
 Configuration management module.
 """
 
+import copy
 import json
 import logging
+from collections import ChainMap
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple
 import os
 import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+# Parsed user overrides keyed by (path, mtime_ns); editing the file invalidates its entry
+_CONFIG_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
 
 class ConfigManager:
     """Manage application configuration."""
     
-    DEFAULT_CONFIG = {
+    # Read-only and shared by every manager, which layers its own overrides on
+    # top via ChainMap; values must be immutable too (tuples, not lists)
+    DEFAULT_CONFIG = MappingProxyType({
         "gemini_api_key": "",
         "model_name": "gemini-1.5-flash",
         "temperature": 0.3,
         "max_tokens": 8192,
         "output_dir": "~/Desktop/pdf_knowledge_extractor",
-        "supported_formats": ["markdown", "txt"],
+        "supported_formats": ("markdown", "txt"),
         "log_level": "DEBUG",
         "max_images_per_pdf": 10,
         "image_dpi": 200,
         "concurrent_processing": True,
         "max_workers": 4
-    }
+    })
     
     def __init__(self, config_path: Optional[Path] = None):
         """Initialize configuration manager.
@@ -36,6 +64,7 @@ class ConfigManager:
         self.logger = logging.getLogger(__name__)
         self.config_path = self._determine_config_path(config_path)
         self.config = self._load_config()
+        self._snapshot()
         
     def _determine_config_path(self, config_path: Optional[Path]) -> Path:
         """Determine the configuration file path."""
@@ -57,18 +86,25 @@ class ConfigManager:
             
         return base_path / "config.json"
     
-    def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from file."""
+    def _load_config(self) -> ChainMap:
+        """Load configuration from file.
+        
+        Returns:
+            ChainMap of the user overrides in front of DEFAULT_CONFIG
+        """
         if not self.config_path.exists():
             self.logger.warning(f"Config file not found at {self.config_path}, using defaults")
-            return self.DEFAULT_CONFIG.copy()
+            return ChainMap({}, self.DEFAULT_CONFIG)
             
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                user_config = json.load(f)
+            cache_key = (str(self.config_path), self.config_path.stat().st_mtime_ns)
+            if cache_key in _CONFIG_CACHE:
+                return ChainMap(copy.deepcopy(_CONFIG_CACHE[cache_key]), self.DEFAULT_CONFIG)
+            
+            user_config = _json_loads(self.config_path.read_bytes())
                 
-            # Merge with defaults
-            config = self.DEFAULT_CONFIG.copy()
+            # Overrides only; defaults are looked up through the ChainMap
+            config = {}
             
             # Handle nested output configuration
             if 'output' in user_config and 'output_directory' in user_config['output']:
@@ -80,17 +116,35 @@ class ConfigManager:
                     config[key] = value
             
             # Expand paths
-            if 'output_dir' in config:
-                config['output_dir'] = str(Path(config['output_dir']).expanduser())
-                
-            return config
+            output_dir = config.get('output_dir', self.DEFAULT_CONFIG['output_dir'])
+            config['output_dir'] = str(Path(output_dir).expanduser())
+            
+            _CONFIG_CACHE[cache_key] = config
+            return ChainMap(copy.deepcopy(config), self.DEFAULT_CONFIG)
             
         except json.JSONDecodeError as e:
             self.logger.error(f"Invalid JSON in config file: {e}")
-            return self.DEFAULT_CONFIG.copy()
+            return ChainMap({}, self.DEFAULT_CONFIG)
         except Exception as e:
             self.logger.error(f"Error loading config: {e}")
-            return self.DEFAULT_CONFIG.copy()
+            return ChainMap({}, self.DEFAULT_CONFIG)
+    
+    def _snapshot(self):
+        """Cache frequently read settings as attributes."""
+        self.api_key = self.config.get('gemini_api_key', '')
+        self.max_workers = self._int_setting('max_workers')
+        self.max_images = self._int_setting('max_images_per_pdf')
+        self.output_dir = Path(self.config.get('output_dir', '')).expanduser()
+    
+    def _int_setting(self, key: str) -> int:
+        """Read an integer setting, falling back to its default if malformed."""
+        value = self.config.get(key)
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            default = self.DEFAULT_CONFIG[key]
+            self.logger.warning(f"Invalid {key} in config: {value!r}, using {default}")
+            return default
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value.
@@ -111,13 +165,13 @@ class ConfigManager:
             key: Configuration key
             value: Configuration value
         """
-        self.config[key] = value
+        self.config.maps[0][key] = value
+        self._snapshot()
         
     def save(self):
         """Save configuration to file."""
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, ensure_ascii=False, indent=2)
+            self.config_path.write_bytes(_json_dumps(dict(self.config)))
             self.logger.info(f"Configuration saved to {self.config_path}")
         except Exception as e:
             self.logger.error(f"Error saving configuration: {e}")
@@ -129,12 +183,12 @@ class ConfigManager:
             True if configuration is valid
         """
         # Check required fields
-        if not self.config.get('gemini_api_key'):
+        if not self.api_key:
             self.logger.error("Gemini API key is required")
             return False
             
         # Check output directory
-        output_dir = Path(self.config.get('output_dir', ''))
+        output_dir = self.output_dir
         if not output_dir.parent.exists():
             self.logger.error(f"Output directory parent does not exist: {output_dir.parent}")
             return False
@@ -4,6 +4,7 @@ Logging configuration module.
 
 import logging
 import sys
+import time
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -49,7 +50,9 @@ def setup_logger(name: str = None, log_dir: Optional[Path] = None,
         # Create log file with timestamp
         log_file = log_dir / f"pdf_extractor_{datetime.now().strftime('%Y%m%d')}.log"
         
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        # Single file handler at DEBUG level; the log file is not opened
+        # until the first record is written
+        file_handler = logging.FileHandler(log_file, encoding='utf-8', delay=True)
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(detailed_formatter)
         logger.addHandler(file_handler)
@@ -61,14 +64,6 @@ def setup_logger(name: str = None, log_dir: Optional[Path] = None,
         console_handler.setFormatter(simple_formatter)
         logger.addHandler(console_handler)
     
-    # Debug log handler for errors
-    if log_dir:
-        debug_log = log_dir / "debug.log"
-        debug_handler = logging.FileHandler(debug_log, encoding='utf-8')
-        debug_handler.setLevel(logging.DEBUG)
-        debug_handler.setFormatter(detailed_formatter)
-        logger.addHandler(debug_handler)
-    
     return logger
 
 
@@ -87,6 +82,9 @@ def get_logger(name: str) -> logging.Logger:
 class ProgressLogger:
     """Logger for tracking progress of operations."""
     
+    # Emit a progress line (and compute the ETA) once per this many items
+    LOG_EVERY = 16
+    
     def __init__(self, logger: logging.Logger, total_items: int, 
                  description: str = "Processing"):
         """Initialize progress logger.
@@ -100,7 +98,7 @@ class ProgressLogger:
         self.total_items = total_items
         self.description = description
         self.current_item = 0
-        self.start_time = datetime.now()
+        self.start_time = time.monotonic()
         
     def update(self, item_name: str = None):
         """Update progress.
@@ -109,15 +107,16 @@ class ProgressLogger:
             item_name: Name of current item being processed
         """
         self.current_item += 1
+        # Always report the first and last items; in between, one in LOG_EVERY
+        if (self.current_item % self.LOG_EVERY and self.current_item != 1
+                and self.current_item != self.total_items):
+            return
         percentage = (self.current_item / self.total_items) * 100
         
-        elapsed = (datetime.now() - self.start_time).total_seconds()
-        if self.current_item > 0:
-            rate = elapsed / self.current_item
-            eta = rate * (self.total_items - self.current_item)
-            eta_str = f", ETA: {int(eta)}s"
-        else:
-            eta_str = ""
+        elapsed = time.monotonic() - self.start_time
+        rate = elapsed / self.current_item
+        eta = rate * (self.total_items - self.current_item)
+        eta_str = f", ETA: {int(eta)}s"
         
         msg = f"{self.description}: {self.current_item}/{self.total_items} ({percentage:.1f}%){eta_str}"
         if item_name:
@@ -127,7 +126,7 @@ class ProgressLogger:
         
     def complete(self):
         """Mark operation as complete."""
-        elapsed = (datetime.now() - self.start_time).total_seconds()
+        elapsed = time.monotonic() - self.start_time
         self.logger.info(
             f"{self.description} completed: {self.total_items} items in {elapsed:.1f}s"
         )
\ No newline at end of file
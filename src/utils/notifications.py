@@ -3,29 +3,89 @@ Notification management module for macOS.
 """
 
 import sys
+import time
+import queue
 import logging
+import threading
 import subprocess
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+
+# Queue sentinel that tells the delivery thread to exit
+_STOP = object()
+
+# Escapes for text interpolated into an AppleScript string literal. Line
+# breaks are escaped too, since the interpreter runs one statement per line
+_OSA_ESC = str.maketrans({'"': '\\"', '\\': '\\\\', '\n': '\\n', '\r': '\\r'})
+
+# PyObjC is imported once per process, and only on macOS
+_NSUserNotification = None
+_NSUserNotificationCenter = None
+_NATIVE_OK = False
+if sys.platform == "darwin":
+    try:
+        from Foundation import NSUserNotification as _NSUserNotification
+        from Foundation import NSUserNotificationCenter as _NSUserNotificationCenter
+        _NATIVE_OK = True
+    except ImportError:
+        pass
+
+
+def _noop(*args, **kwargs):
+    """Stand-in for the send methods where notifications are unsupported."""
 
 
 class NotificationManager:
     """Manage system notifications."""
     
+    # Progress notifications are coalesced to one per interval or step
+    PROGRESS_MIN_INTERVAL = 1.0
+    PROGRESS_MIN_STEP = 5
+    
+    # Errors are batched into one notification; names listed in the summary
+    ERROR_BATCH_DELAY = 0.5
+    ERROR_BATCH_MAX_NAMES = 3
+    
     def __init__(self):
         """Initialize notification manager."""
         self.logger = logging.getLogger(__name__)
         self.enabled = sys.platform == "darwin"  # Only enable on macOS
         
-        # Try to import macOS notification libraries
         if self.enabled:
-            try:
-                from Foundation import NSUserNotification, NSUserNotificationCenter
-                self.NSUserNotification = NSUserNotification
-                self.NSUserNotificationCenter = NSUserNotificationCenter
-                self.use_native = True
-            except ImportError:
+            self.NSUserNotification = _NSUserNotification
+            self.NSUserNotificationCenter = _NSUserNotificationCenter
+            self.use_native = _NATIVE_OK
+            if _NATIVE_OK:
+                # The default center is a process-wide singleton
+                self._center = _NSUserNotificationCenter.defaultUserNotificationCenter()
+                self._new_notification = _NSUserNotification.new
+            else:
                 self.logger.warning("Native macOS notification libraries not available")
-                self.use_native = False
+        else:
+            # Rebind the public senders so callers skip even message formatting
+            self.use_native = False
+            self.send = self.send_progress = self.send_completion = self.send_error = _noop
+            self.logger.debug("Notifications disabled on this platform")
+        
+        # Notifications are delivered by a background thread, started on first send
+        self._queue = queue.Queue()
+        self._worker_thread: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        
+        # Persistent osascript interpreter, started on first use
+        self._osa: Optional[subprocess.Popen] = None
+        self._osa_lock = threading.Lock()
+        
+        # Last delivered progress notification
+        self._last_progress_ts = 0.0
+        self._last_progress_pct = -1
+        
+        # Per-operation progress message template and subtitle
+        self._op_cache: Dict[str, Tuple[str, str]] = {}
+        
+        # Errors waiting to be sent as one summary notification
+        self._error_buffer: List[Tuple[str, Optional[str]]] = []
+        self._error_flush_timer: Optional[threading.Timer] = None
+        self._error_lock = threading.Lock()
     
     def send(self, title: str, message: str, subtitle: Optional[str] = None):
         """Send a notification.
@@ -35,37 +95,99 @@ class NotificationManager:
             message: Notification message
             subtitle: Optional subtitle
         """
-        if not self.enabled:
-            self.logger.debug(f"Notifications disabled: {title} - {message}")
+        # Never block the caller (often the Tk thread) on delivery
+        self._ensure_worker()
+        self._queue.put_nowait((title, message, subtitle))
+    
+    def _ensure_worker(self):
+        """Start the delivery thread if it is not running."""
+        if self._worker_thread is not None:
             return
-            
-        try:
-            if self.use_native:
-                self._send_native(title, message, subtitle)
-            else:
-                self._send_osascript(title, message, subtitle)
-        except Exception as e:
-            self.logger.error(f"Error sending notification: {e}")
+        with self._worker_lock:
+            if self._worker_thread is None:
+                self._worker_thread = threading.Thread(
+                    target=self._worker, name="NotificationWorker", daemon=True
+                )
+                self._worker_thread.start()
+    
+    def _worker(self):
+        """Deliver queued notifications until shutdown() is called."""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            try:
+                if self.use_native:
+                    self._send_native(*item)
+                else:
+                    self._send_osascript(*item)
+            except Exception as e:
+                self.logger.error(f"Error sending notification: {e}")
+    
+    def shutdown(self, timeout: float = 5.0):
+        """Deliver pending notifications and stop the delivery thread.
+        
+        Args:
+            timeout: Maximum seconds to wait for pending notifications
+        """
+        # Send buffered errors now rather than losing them with the timer
+        self._flush_errors()
+        with self._worker_lock:
+            thread, self._worker_thread = self._worker_thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join(timeout)
+        self._close_osascript()
     
     def _send_native(self, title: str, message: str, subtitle: Optional[str] = None):
         """Send notification using native macOS APIs."""
-        notification = self.NSUserNotification.new()
+        notification = self._new_notification()
         notification.setTitle_(title)
         notification.setInformativeText_(message)
         
         if subtitle:
             notification.setSubtitle_(subtitle)
             
-        center = self.NSUserNotificationCenter.defaultUserNotificationCenter()
-        center.deliverNotification_(notification)
+        self._center.deliverNotification_(notification)
         
     def _send_osascript(self, title: str, message: str, subtitle: Optional[str] = None):
         """Send notification using osascript."""
-        script = f'display notification "{message}" with title "{title}"'
+        script = f'display notification "{message.translate(_OSA_ESC)}" with title "{title.translate(_OSA_ESC)}"'
         if subtitle:
-            script += f' subtitle "{subtitle}"'
-            
-        subprocess.run(['osascript', '-e', script], capture_output=True)
+            script += f' subtitle "{subtitle.translate(_OSA_ESC)}"'
+        
+        with self._osa_lock:
+            for attempt in range(2):
+                if self._osa is None or self._osa.poll() is not None:
+                    # One long-lived interpreter instead of a fork/exec per notification
+                    self._osa = subprocess.Popen(
+                        ['osascript', '-i'],
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        text=True,
+                        encoding='utf-8',
+                        bufsize=1
+                    )
+                try:
+                    self._osa.stdin.write(script + "\n")
+                    self._osa.stdin.flush()
+                    return
+                except (BrokenPipeError, OSError):
+                    # The interpreter exited; start a fresh one and retry once
+                    self._osa = None
+                    if attempt:
+                        raise
+    
+    def _close_osascript(self):
+        """Close the osascript interpreter, letting it finish queued commands."""
+        with self._osa_lock:
+            osa, self._osa = self._osa, None
+        if osa is not None:
+            try:
+                osa.stdin.close()
+            except OSError:
+                pass
     
     def send_progress(self, current: int, total: int, operation: str = "Processing"):
         """Send progress notification.
@@ -76,11 +198,35 @@ class NotificationManager:
             operation: Operation description
         """
         percentage = (current / total) * 100 if total > 0 else 0
-        self.send(
-            "PDF Knowledge Extractor",
-            f"{operation}: {current}/{total} ({percentage:.0f}%)",
-            f"Processing {operation.lower()}"
-        )
+        pct = int(percentage)
+        now = time.monotonic()
+        if pct < self._last_progress_pct:
+            # Progress went backwards, so this is a new batch
+            self._last_progress_ts = 0.0
+            self._last_progress_pct = -1
+        # Drop updates that arrive too soon after the last one, unless the
+        # percentage moved noticeably or this is the final item
+        if (now - self._last_progress_ts < self.PROGRESS_MIN_INTERVAL
+                and pct < self._last_progress_pct + self.PROGRESS_MIN_STEP
+                and current != total):
+            return
+        if current == total:
+            # Batch finished; let the next batch's first update through
+            self._last_progress_ts = 0.0
+            self._last_progress_pct = -1
+        else:
+            self._last_progress_ts = now
+            self._last_progress_pct = pct
+        
+        try:
+            template, subtitle = self._op_cache[operation]
+        except KeyError:
+            # "%%" survives the first substitution as the literal percent sign
+            template = operation.replace("%", "%%") + ": %d/%d (%.0f%%)"
+            subtitle = "Processing " + operation.lower()
+            self._op_cache[operation] = (template, subtitle)
+        
+        self.send("PDF Knowledge Extractor", template % (current, total, percentage), subtitle)
     
     def send_completion(self, success_count: int, total_count: int, 
                        operation: str = "Extraction"):
@@ -91,6 +237,8 @@ class NotificationManager:
             total_count: Total number of items
             operation: Operation description
         """
+        # Report batched errors before the summary that counts them
+        self._flush_errors()
         if success_count == total_count:
             self.send(
                 f"{operation} Complete",
@@ -108,14 +256,61 @@ class NotificationManager:
     def send_error(self, error_message: str, file_name: Optional[str] = None):
         """Send error notification.
         
+        Errors arriving within ERROR_BATCH_DELAY of each other are combined
+        into a single notification.
+        
         Args:
             error_message: Error message
             file_name: Optional file name that caused the error
         """
+        with self._error_lock:
+            self._error_buffer.append((error_message, file_name))
+            if self._error_flush_timer is not None:
+                self._error_flush_timer.cancel()
+            self._error_flush_timer = threading.Timer(self.ERROR_BATCH_DELAY, self._flush_errors)
+            self._error_flush_timer.daemon = True
+            self._error_flush_timer.start()
+    
+    def _flush_errors(self):
+        """Send one notification for all buffered errors."""
+        with self._error_lock:
+            errors, self._error_buffer = self._error_buffer, []
+            if self._error_flush_timer is not None:
+                self._error_flush_timer.cancel()
+                self._error_flush_timer = None
+        if not errors:
+            return
+        
         title = "PDF Knowledge Extractor Error"
-        if file_name:
-            message = f"Error processing {file_name}: {error_message}"
+        if len(errors) == 1:
+            error_message, file_name = errors[0]
+            if file_name:
+                message = f"Error processing {file_name}: {error_message}"
+            else:
+                message = f"Error: {error_message}"
         else:
-            message = f"Error: {error_message}"
+            names = [file_name or error_message for error_message, file_name in errors]
+            shown = ", ".join(names[:self.ERROR_BATCH_MAX_NAMES])
+            if len(names) > self.ERROR_BATCH_MAX_NAMES:
+                shown += ", …"
+            message = f"{len(errors)} errors: {shown}"
             
-        self.send(title, message, "An error occurred")
\ No newline at end of file
+        self.send(title, message, "An error occurred")
+
+
+_INSTANCE: Optional[NotificationManager] = None
+_INSTANCE_LOCK = threading.Lock()
+
+
+def get_notification_manager() -> NotificationManager:
+    """Get the shared notification manager.
+    
+    Returns:
+        Process-wide NotificationManager instance
+    """
+    global _INSTANCE
+    if _INSTANCE is None:
+        with _INSTANCE_LOCK:
+            if _INSTANCE is None:
+                _INSTANCE = NotificationManager()
+    return _INSTANCE
\ No newline at end of file
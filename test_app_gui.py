@@ -1,19 +1,63 @@
 #!/usr/bin/env python3
 """Test the app.py GUI directly"""
 
+import queue
 import sys
+import threading
+import tkinter as tk
 sys.path.insert(0, '/Users/hideki/pdf_knowledge_extractor_mac/src')
 
-from app import PDFKnowledgeExtractorApp
+from gui.ui_queue import bind_queue
 
-try:
-    print("Initializing PDFKnowledgeExtractorApp...")
-    app = PDFKnowledgeExtractorApp()
+
+def main():
+    # Draw a window before the heavy app imports so it never shows up blank
+    root = tk.Tk()
+    root.title("Loading…")
+    root.geometry("600x500")
+    root.update_idletasks()
+    x = (root.winfo_screenwidth() // 2) - (600 // 2)
+    y = (root.winfo_screenheight() // 2) - (500 // 2)
+    root.geometry(f"600x500+{x}+{y}")
     
-    print("Running GUI...")
-    app.run_gui()
+    splash = tk.Label(root, text="Loading PDF Knowledge Extractor…", font=("Arial", 14))
+    splash.pack(expand=True)
+    root.update()
+    
+    post = bind_queue(root, queue.Queue())
+    loaded = {}
+    
+    def on_loaded(app):
+        loaded["app"] = app
+        # Leave the splash mainloop so run_gui() can take over the window
+        root.quit()
+    
+    def load_app():
+        try:
+            # Pulls in PyMuPDF, PIL and google.generativeai
+            from app import PDFKnowledgeExtractorApp
+            
+            print("Initializing PDFKnowledgeExtractorApp...")
+            app = PDFKnowledgeExtractorApp()
+            post(on_loaded, app)
+        except Exception as e:
+            print(f"Error: {e}")
+            import traceback
+            traceback.print_exc()
+            post(root.destroy)
     
-except Exception as e:
-    print(f"Error: {e}")
-    import traceback
-    traceback.print_exc()
\ No newline at end of file
+    threading.Thread(target=load_app, daemon=True).start()
+    root.mainloop()
+    
+    # Loading failed or the window was closed first
+    app = loaded.get("app")
+    if app is None:
+        return
+    
+    print("Running GUI...")
+    splash.destroy()
+    app.run_gui(root)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
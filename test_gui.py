@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
 """Test GUI to debug the white screen issue."""
 
+import queue
 import sys
+import threading
 import tkinter as tk
+from pathlib import Path
 from tkinter import ttk
-sys.path.insert(0, '/Users/hideki/pdf_knowledge_extractor_mac/src')
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from gui.ui_queue import bind_queue
 
 try:
     print("Starting test GUI...")
@@ -18,7 +23,13 @@ try:
     label = ttk.Label(root, text="Test Label", font=("Arial", 14))
     label.pack(pady=20)
     
-    button = ttk.Button(root, text="Test Button", command=lambda: print("Button clicked!"))
+    # Background work reports back through the Tk event loop
+    post = bind_queue(root, queue.Queue())
+    
+    def on_click():
+        threading.Thread(target=post, args=(print, "Button clicked!"), daemon=True).start()
+    
+    button = ttk.Button(root, text="Test Button", command=on_click)
     button.pack(pady=10)
     
     print("GUI created successfully")
@@ -162,6 +162,21 @@ class TestAIAnalyzer(unittest.TestCase):
             self.assertIn("この文書からは", result[category][0])
             self.assertIn("に関する明確な情報を特定できませんでした", result[category][0])
             
+    def test_parse_response_category_order_precedence(self):
+        """Test that a header naming two categories picks the first in category order."""
+        analyzer = AIAnalyzer({})
+        
+        response_text = """
+6. ベストプラクティス（概念・理論を含む）
+- 推奨と理論の組み合わせ
+"""
+        
+        result = analyzer._parse_response(response_text)
+        
+        # Assertions
+        self.assertIn("推奨と理論の組み合わせ", result["概念・理論"])
+        self.assertNotIn("推奨と理論の組み合わせ", result["ベストプラクティス"])
+        
     @patch('core.analyzer.genai')
     def test_analyze_error_handling(self, mock_genai):
         """Test error handling in analyze method."""
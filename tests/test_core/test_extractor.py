@@ -2,146 +2,168 @@
 Unit tests for PDF extractor module.
 """
 
-import unittest
-import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+import pytest
+
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
 from core.extractor import PDFExtractor
 
 
-class TestPDFExtractor(unittest.TestCase):
-    """Test cases for PDFExtractor class."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.extractor = PDFExtractor(self.temp_dir)
-        
-    def tearDown(self):
-        """Clean up test fixtures."""
-        self.extractor.cleanup()
-        
-    @patch('core.extractor.fitz')
-    def test_extract_text_success(self, mock_fitz):
-        """Test successful text extraction."""
-        # Mock PyMuPDF
-        mock_doc = MagicMock()
-        mock_page = MagicMock()
-        mock_page.get_text.return_value = "Sample PDF text"
-        mock_doc.__len__.return_value = 1
-        mock_doc.__getitem__.return_value = mock_page
-        mock_fitz.open.return_value = mock_doc
-        
-        # Test
-        pdf_path = Path("/fake/path/test.pdf")
-        result = self.extractor.extract_text(pdf_path)
-        
-        # Assertions
-        self.assertEqual(result, "Sample PDF text")
-        mock_fitz.open.assert_called_once_with(pdf_path)
-        mock_doc.close.assert_called_once()
-        
-    @patch('core.extractor.fitz')
-    def test_extract_text_error(self, mock_fitz):
-        """Test text extraction error handling."""
-        # Mock exception
-        mock_fitz.open.side_effect = Exception("PDF error")
-        
-        # Test
-        pdf_path = Path("/fake/path/test.pdf")
-        
-        with self.assertRaises(Exception) as context:
-            self.extractor.extract_text(pdf_path)
-        
-        self.assertIn("PDF error", str(context.exception))
-        
-    @patch('core.extractor.fitz')
-    def test_extract_images_success(self, mock_fitz):
-        """Test successful image extraction."""
-        # Mock PyMuPDF
-        mock_doc = MagicMock()
-        mock_page = MagicMock()
-        mock_pix = MagicMock()
-        mock_page.get_pixmap.return_value = mock_pix
-        mock_doc.__len__.return_value = 2
-        mock_doc.__getitem__.return_value = mock_page
-        mock_fitz.open.return_value = mock_doc
-        
-        # Test
-        pdf_path = Path("/fake/path/test.pdf")
-        result = self.extractor.extract_images(pdf_path, max_images=2)
-        
-        # Assertions
-        self.assertEqual(len(result), 2)
-        self.assertTrue(all(isinstance(p, Path) for p in result))
-        mock_fitz.open.assert_called_once_with(pdf_path)
-        
-    @patch('core.extractor.fitz')
-    def test_extract_images_max_limit(self, mock_fitz):
-        """Test image extraction respects max_images limit."""
-        # Mock PyMuPDF with more pages than limit
-        mock_doc = MagicMock()
-        mock_page = MagicMock()
-        mock_pix = MagicMock()
-        mock_page.get_pixmap.return_value = mock_pix
-        mock_doc.__len__.return_value = 5
-        mock_doc.__getitem__.return_value = mock_page
-        mock_fitz.open.return_value = mock_doc
-        
-        # Test
-        pdf_path = Path("/fake/path/test.pdf")
-        result = self.extractor.extract_images(pdf_path, max_images=3)
-        
-        # Assertions
-        self.assertEqual(len(result), 3)
-        
-    @patch('core.extractor.fitz')
-    def test_extract_combined(self, mock_fitz):
-        """Test combined text and image extraction."""
-        # Mock PyMuPDF for both text and image extraction
-        mock_doc_text = MagicMock()
-        mock_page_text = MagicMock()
-        mock_page_text.get_text.return_value = "Sample text"
-        mock_doc_text.__len__.return_value = 1
-        mock_doc_text.__getitem__.return_value = mock_page_text
-        
-        mock_doc_images = MagicMock()
-        mock_page_images = MagicMock()
-        mock_pix = MagicMock()
-        mock_page_images.get_pixmap.return_value = mock_pix
-        mock_doc_images.__len__.return_value = 1
-        mock_doc_images.__getitem__.return_value = mock_page_images
-        
-        # Return different mock docs for different calls
-        mock_fitz.open.side_effect = [mock_doc_text, mock_doc_images]
-        
-        # Test
-        pdf_path = Path("/fake/path/test.pdf")
-        text, images = self.extractor.extract(pdf_path)
-        
-        # Assertions
-        self.assertEqual(text, "Sample text")
-        self.assertEqual(len(images), 1)
-        
-    def test_cleanup(self):
-        """Test cleanup functionality."""
-        # Create a test file in temp directory
-        test_file = self.temp_dir / "test.txt"
-        test_file.write_text("test")
-        
-        # Verify file exists
-        self.assertTrue(test_file.exists())
-        
-        # Test cleanup
-        self.extractor.cleanup()
-        
-        # Verify directory is removed
-        self.assertFalse(self.temp_dir.exists())
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+@pytest.fixture(scope="module")
+def temp_root(tmp_path_factory):
+    """Temporary directory shared by the tests in this module."""
+    return tmp_path_factory.mktemp("extractor")
+
+
+@pytest.fixture
+def extractor(temp_root):
+    """PDFExtractor writing into the shared temporary directory."""
+    return PDFExtractor(temp_root)
+
+
+@patch('core.extractor.fitz')
+def test_extract_text_success(mock_fitz, extractor):
+    """Test successful text extraction."""
+    # Mock PyMuPDF
+    mock_doc = MagicMock()
+    mock_page = MagicMock()
+    mock_page.get_text.return_value = "Sample PDF text"
+    mock_doc.__iter__.return_value = iter([mock_page])
+    mock_fitz.open.return_value = mock_doc
+    
+    # Test
+    pdf_path = Path("/fake/path/test.pdf")
+    result = extractor.extract_text(pdf_path)
+    
+    # Assertions
+    assert result == "Sample PDF text"
+    mock_fitz.open.assert_called_once_with(pdf_path)
+    mock_doc.close.assert_called_once()
+
+
+@patch('core.extractor.fitz')
+def test_extract_text_error(mock_fitz, extractor):
+    """Test text extraction error handling."""
+    # Mock exception
+    mock_fitz.open.side_effect = Exception("PDF error")
+    
+    # Test
+    pdf_path = Path("/fake/path/test.pdf")
+    
+    with pytest.raises(Exception, match="PDF error"):
+        extractor.extract_text(pdf_path)
+
+
+@patch('core.extractor.fitz')
+def test_extract_images_success(mock_fitz, extractor):
+    """Test successful image extraction."""
+    # Mock PyMuPDF
+    mock_doc = MagicMock()
+    mock_page = MagicMock()
+    mock_pix = MagicMock()
+    mock_page.get_pixmap.return_value = mock_pix
+    mock_doc.__iter__.return_value = iter([mock_page] * 2)
+    mock_fitz.open.return_value = mock_doc
+    
+    # Test
+    pdf_path = Path("/fake/path/test.pdf")
+    result = extractor.extract_images(pdf_path, max_images=2)
+    
+    # Assertions
+    assert len(result) == 2
+    assert all(isinstance(p, Path) for p in result)
+    mock_fitz.open.assert_called_once_with(pdf_path)
+
+
+@patch('core.extractor.fitz')
+def test_extract_images_max_limit(mock_fitz, extractor):
+    """Test image extraction respects max_images limit."""
+    # Mock PyMuPDF with more pages than limit
+    mock_doc = MagicMock()
+    mock_page = MagicMock()
+    mock_pix = MagicMock()
+    mock_page.get_pixmap.return_value = mock_pix
+    mock_doc.__iter__.return_value = iter([mock_page] * 5)
+    mock_fitz.open.return_value = mock_doc
+    
+    # Test
+    pdf_path = Path("/fake/path/test.pdf")
+    result = extractor.extract_images(pdf_path, max_images=3)
+    
+    # Assertions
+    assert len(result) == 3
+
+
+@patch('core.extractor.fitz')
+def test_extract_combined(mock_fitz, extractor):
+    """Test combined text and image extraction."""
+    # Mock PyMuPDF for both text and image extraction
+    mock_doc_text = MagicMock()
+    mock_page_text = MagicMock()
+    mock_page_text.get_text.return_value = "Sample text"
+    mock_doc_text.__iter__.return_value = iter([mock_page_text])
+    
+    mock_doc_images = MagicMock()
+    mock_page_images = MagicMock()
+    mock_pix = MagicMock()
+    mock_page_images.get_pixmap.return_value = mock_pix
+    mock_doc_images.__iter__.return_value = iter([mock_page_images])
+    
+    # Return different mock docs for different calls
+    mock_fitz.open.side_effect = [mock_doc_text, mock_doc_images]
+    
+    # Test
+    pdf_path = Path("/fake/path/test.pdf")
+    text, images = extractor.extract(pdf_path)
+    
+    # Assertions
+    assert text == "Sample text"
+    assert len(images) == 1
+
+
+@patch('core.extractor.fitz')
+def test_extract_raw_text_only_counts_blocks(mock_fitz, extractor):
+    """Test raw extraction reports the total block count."""
+    # Mock PyMuPDF with two text blocks and one image block per page
+    mock_doc = MagicMock()
+    mock_page = MagicMock()
+    text_block = {"lines": [{"spans": [{"text": "Block", "font": "Arial", "size": 12, "flags": 0}]}], "bbox": [0, 0, 1, 1]}
+    mock_page.get_text.side_effect = lambda *args: (
+        {"blocks": [text_block, text_block, {"type": 1}]} if args else "Page text"
+    )
+    mock_doc.__len__.return_value = 3
+    mock_doc.__iter__.return_value = iter([mock_page] * 3)
+    mock_fitz.open.return_value = mock_doc
+    
+    # Test
+    pdf_path = Path("/fake/path/test.pdf")
+    result = extractor.extract_raw_text_only(pdf_path)
+    
+    # Assertions
+    assert result['total_pages'] == 3
+    assert result['total_blocks'] == 6
+
+
+def test_cleanup(tmp_path):
+    """Test cleanup functionality."""
+    # Cleanup removes its directory, so this test gets its own
+    temp_dir = tmp_path / "extractor"
+    temp_dir.mkdir()
+    extractor = PDFExtractor(temp_dir)
+    
+    # Create a test file in temp directory
+    test_file = temp_dir / "test.txt"
+    test_file.write_text("test")
+    
+    # Verify file exists
+    assert test_file.exists()
+    
+    # Test cleanup
+    extractor.cleanup()
+    
+    # Verify directory is removed
+    assert not temp_dir.exists()
\ No newline at end of file
@@ -2,190 +2,252 @@
 Unit tests for configuration manager.
 """
 
-import unittest
-import tempfile
 import json
+import os
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
 from utils.config_manager import ConfigManager
 
 
-class TestConfigManager(unittest.TestCase):
-    """Test cases for ConfigManager class."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.config_file = self.temp_dir / "config.json"
-        
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-        
-    def test_load_default_config(self):
-        """Test loading default configuration when file doesn't exist."""
-        # Use non-existent config file
-        config_manager = ConfigManager(Path("/non/existent/config.json"))
-        
-        # Should load defaults
-        self.assertEqual(
-            config_manager.get("model_name"), 
-            ConfigManager.DEFAULT_CONFIG["model_name"]
-        )
-        self.assertEqual(
-            config_manager.get("temperature"),
-            ConfigManager.DEFAULT_CONFIG["temperature"]
-        )
-        
-    def test_load_valid_config(self):
-        """Test loading valid configuration file."""
-        # Create test config
-        test_config = {
-            "gemini_api_key": "test_key",
-            "model_name": "test_model",
-            "temperature": 0.5
-        }
-        
-        with open(self.config_file, 'w') as f:
-            json.dump(test_config, f)
-            
-        # Load config
-        config_manager = ConfigManager(self.config_file)
-        
-        # Check values
-        self.assertEqual(config_manager.get("gemini_api_key"), "test_key")
-        self.assertEqual(config_manager.get("model_name"), "test_model")
-        self.assertEqual(config_manager.get("temperature"), 0.5)
-        
-        # Check that defaults are merged
-        self.assertEqual(
-            config_manager.get("max_tokens"),
-            ConfigManager.DEFAULT_CONFIG["max_tokens"]
-        )
-        
-    def test_load_invalid_json(self):
-        """Test handling of invalid JSON configuration."""
-        # Create invalid JSON file
-        with open(self.config_file, 'w') as f:
-            f.write("{ invalid json }")
-            
-        # Should fall back to defaults
-        config_manager = ConfigManager(self.config_file)
-        
-        self.assertEqual(
-            config_manager.get("model_name"),
-            ConfigManager.DEFAULT_CONFIG["model_name"]
-        )
-        
-    def test_get_set_operations(self):
-        """Test get and set operations."""
-        config_manager = ConfigManager(self.config_file)
-        
-        # Test get with default
-        self.assertEqual(config_manager.get("non_existent", "default"), "default")
-        
-        # Test set
-        config_manager.set("test_key", "test_value")
-        self.assertEqual(config_manager.get("test_key"), "test_value")
-        
-    def test_save_config(self):
-        """Test saving configuration to file."""
-        config_manager = ConfigManager(self.config_file)
-        
-        # Modify config
-        config_manager.set("test_key", "test_value")
-        
-        # Save
-        config_manager.save()
-        
-        # Verify file was created and contains correct data
-        self.assertTrue(self.config_file.exists())
-        
-        with open(self.config_file, 'r') as f:
-            saved_config = json.load(f)
-            
-        self.assertEqual(saved_config["test_key"], "test_value")
-        
-    def test_validate_valid_config(self):
-        """Test validation of valid configuration."""
-        # Create valid config
-        test_config = {
-            "gemini_api_key": "valid_key",
-            "output_dir": str(self.temp_dir)
-        }
-        
-        with open(self.config_file, 'w') as f:
-            json.dump(test_config, f)
-            
-        config_manager = ConfigManager(self.config_file)
-        
-        # Should be valid
-        self.assertTrue(config_manager.validate())
-        
-    def test_validate_missing_api_key(self):
-        """Test validation with missing API key."""
-        # Create config without API key
-        test_config = {
-            "output_dir": str(self.temp_dir)
-        }
-        
-        with open(self.config_file, 'w') as f:
-            json.dump(test_config, f)
-            
-        config_manager = ConfigManager(self.config_file)
-        
-        # Should be invalid
-        self.assertFalse(config_manager.validate())
-        
-    def test_validate_invalid_output_dir(self):
-        """Test validation with invalid output directory."""
-        # Create config with invalid output directory
-        test_config = {
-            "gemini_api_key": "valid_key",
-            "output_dir": "/non/existent/parent/directory"
-        }
-        
-        with open(self.config_file, 'w') as f:
-            json.dump(test_config, f)
-            
-        config_manager = ConfigManager(self.config_file)
-        
-        # Should be invalid
-        self.assertFalse(config_manager.validate())
-        
-    @patch('sys.frozen', True, create=True)
-    @patch('sys._MEIPASS', "/fake/meipass", create=True)
-    def test_determine_config_path_frozen(self):
-        """Test config path determination for frozen application."""
-        config_manager = ConfigManager()
-        
-        # Should use _MEIPASS when frozen
-        expected_path = Path("/fake/meipass") / "config.json"
-        self.assertEqual(config_manager.config_path, expected_path)
-        
-    def test_path_expansion(self):
-        """Test path expansion in configuration."""
-        # Create config with path that needs expansion
-        test_config = {
-            "gemini_api_key": "test_key",
-            "output_dir": "~/test_output"
-        }
-        
-        with open(self.config_file, 'w') as f:
-            json.dump(test_config, f)
-            
-        config_manager = ConfigManager(self.config_file)
-        
-        # Should expand the path
-        output_dir = config_manager.get("output_dir")
-        self.assertFalse(output_dir.startswith("~"))
-        self.assertTrue(Path(output_dir).is_absolute())
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+@pytest.fixture
+def config_file(tmp_path):
+    """Path to a config file in a per-test temporary directory."""
+    return tmp_path / "config.json"
+
+
+def write_config(path: Path, config: dict):
+    """Write a config dict as JSON."""
+    with open(path, 'w') as f:
+        json.dump(config, f)
+
+
+def test_load_default_config():
+    """Test loading default configuration when file doesn't exist."""
+    # Use non-existent config file
+    config_manager = ConfigManager(Path("/non/existent/config.json"))
+    
+    # Should load defaults
+    assert config_manager.get("model_name") == ConfigManager.DEFAULT_CONFIG["model_name"]
+    assert config_manager.get("temperature") == ConfigManager.DEFAULT_CONFIG["temperature"]
+
+
+def test_load_valid_config(config_file):
+    """Test loading valid configuration file."""
+    # Create test config
+    write_config(config_file, {
+        "gemini_api_key": "test_key",
+        "model_name": "test_model",
+        "temperature": 0.5
+    })
+    
+    # Load config
+    config_manager = ConfigManager(config_file)
+    
+    # Check values
+    assert config_manager.get("gemini_api_key") == "test_key"
+    assert config_manager.get("model_name") == "test_model"
+    assert config_manager.get("temperature") == 0.5
+    
+    # Check that defaults are merged
+    assert config_manager.get("max_tokens") == ConfigManager.DEFAULT_CONFIG["max_tokens"]
+
+
+def test_load_invalid_json(config_file):
+    """Test handling of invalid JSON configuration."""
+    # Create invalid JSON file
+    config_file.write_text("{ invalid json }")
+    
+    # Should fall back to defaults
+    config_manager = ConfigManager(config_file)
+    
+    assert config_manager.get("model_name") == ConfigManager.DEFAULT_CONFIG["model_name"]
+
+
+def test_load_config_cached_until_modified(config_file):
+    """Test that a parsed config is reused until the file changes."""
+    write_config(config_file, {"model_name": "first"})
+    
+    first = ConfigManager(config_file)
+    first.set("model_name", "mutated")
+    
+    # Mutating one manager must not leak into the cached copy
+    with patch('utils.config_manager._json_loads') as mock_load:
+        second = ConfigManager(config_file)
+        mock_load.assert_not_called()
+    assert second.get("model_name") == "first"
+    
+    # Rewriting the file (new mtime) invalidates the entry
+    write_config(config_file, {"model_name": "second"})
+    os.utime(config_file, ns=(0, config_file.stat().st_mtime_ns + 1))
+    
+    assert ConfigManager(config_file).get("model_name") == "second"
+
+
+def test_get_set_operations():
+    """Test get and set operations."""
+    config_manager = ConfigManager(Path("/non/existent/config.json"))
+    
+    # Test get with default
+    assert config_manager.get("non_existent", "default") == "default"
+    
+    # Test set
+    config_manager.set("test_key", "test_value")
+    assert config_manager.get("test_key") == "test_value"
+
+
+def test_save_config(config_file):
+    """Test saving configuration to file."""
+    config_manager = ConfigManager(config_file)
+    
+    # Modify config
+    config_manager.set("test_key", "test_value")
+    
+    # Save
+    config_manager.save()
+    
+    # Verify file was created and contains correct data
+    assert config_file.exists()
+    
+    with open(config_file, 'r') as f:
+        saved_config = json.load(f)
+    
+    assert saved_config["test_key"] == "test_value"
+
+
+def test_validate_valid_config(config_file, tmp_path):
+    """Test validation of valid configuration."""
+    # Create valid config
+    write_config(config_file, {
+        "gemini_api_key": "valid_key",
+        "output_dir": str(tmp_path)
+    })
+    
+    config_manager = ConfigManager(config_file)
+    
+    # Should be valid
+    assert config_manager.validate()
+
+
+def test_validate_missing_api_key(config_file, tmp_path):
+    """Test validation with missing API key."""
+    # Create config without API key
+    write_config(config_file, {
+        "output_dir": str(tmp_path)
+    })
+    
+    config_manager = ConfigManager(config_file)
+    
+    # Should be invalid
+    assert not config_manager.validate()
+
+
+def test_validate_invalid_output_dir(config_file):
+    """Test validation with invalid output directory."""
+    # Create config with invalid output directory
+    write_config(config_file, {
+        "gemini_api_key": "valid_key",
+        "output_dir": "/non/existent/parent/directory"
+    })
+    
+    config_manager = ConfigManager(config_file)
+    
+    # Should be invalid
+    assert not config_manager.validate()
+
+
+def test_determine_config_path_frozen(monkeypatch):
+    """Test config path determination for frozen application."""
+    monkeypatch.setattr(sys, "frozen", True, raising=False)
+    monkeypatch.setattr(sys, "_MEIPASS", "/fake/meipass", raising=False)
+    
+    config_manager = ConfigManager()
+    
+    # Should use _MEIPASS when frozen
+    expected_path = Path("/fake/meipass") / "config.json"
+    assert config_manager.config_path == expected_path
+
+
+def test_path_expansion(config_file):
+    """Test path expansion in configuration."""
+    # Create config with path that needs expansion
+    write_config(config_file, {
+        "gemini_api_key": "test_key",
+        "output_dir": "~/test_output"
+    })
+    
+    config_manager = ConfigManager(config_file)
+    
+    # Should expand the path
+    output_dir = config_manager.get("output_dir")
+    assert not output_dir.startswith("~")
+    assert Path(output_dir).is_absolute()
+
+
+def test_snapshot_attributes(config_file):
+    """Test that hot settings are exposed as attributes and kept in sync."""
+    write_config(config_file, {
+        "gemini_api_key": "test_key",
+        "max_workers": "8",
+        "output_dir": "~/test_output"
+    })
+    
+    config_manager = ConfigManager(config_file)
+    
+    assert config_manager.api_key == "test_key"
+    assert config_manager.max_workers == 8
+    assert config_manager.max_images == ConfigManager.DEFAULT_CONFIG["max_images_per_pdf"]
+    assert config_manager.output_dir == Path("~/test_output").expanduser()
+    
+    # set() refreshes the cached attributes
+    config_manager.set("max_images_per_pdf", 3)
+    assert config_manager.max_images == 3
+
+
+def test_snapshot_falls_back_on_invalid_numbers(config_file):
+    """Test that malformed numeric settings fall back to their defaults."""
+    write_config(config_file, {
+        "max_workers": "auto",
+        "max_images_per_pdf": None
+    })
+    
+    config_manager = ConfigManager(config_file)
+    
+    assert config_manager.max_workers == ConfigManager.DEFAULT_CONFIG["max_workers"]
+    assert config_manager.max_images == ConfigManager.DEFAULT_CONFIG["max_images_per_pdf"]
+    
+    config_manager.set("max_workers", "many")
+    assert config_manager.max_workers == ConfigManager.DEFAULT_CONFIG["max_workers"]
+
+
+def test_defaults_are_shared_and_read_only(config_file):
+    """Test that overrides layer over DEFAULT_CONFIG without copying it."""
+    write_config(config_file, {"model_name": "override"})
+    
+    config_manager = ConfigManager(config_file)
+    config_manager.set("temperature", 0.9)
+    
+    # Writes land in the override layer only
+    assert config_manager.get("temperature") == 0.9
+    assert ConfigManager.DEFAULT_CONFIG["temperature"] == 0.3
+    assert config_manager.config.maps[-1] is ConfigManager.DEFAULT_CONFIG
+    
+    with pytest.raises(TypeError):
+        ConfigManager.DEFAULT_CONFIG["temperature"] = 1.0
+    
+    # Shared default values cannot be mutated in place either
+    with pytest.raises(AttributeError):
+        config_manager.get("supported_formats").append("json")
+    assert ConfigManager.DEFAULT_CONFIG["supported_formats"] == ("markdown", "txt")
+    
+    # Saved file contains the merged view
+    config_manager.save()
+    with open(config_file, 'r') as f:
+        saved_config = json.load(f)
+    assert saved_config["model_name"] == "override"
+    assert saved_config["max_tokens"] == ConfigManager.DEFAULT_CONFIG["max_tokens"]
\ No newline at end of file
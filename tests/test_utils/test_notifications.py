@@ -0,0 +1,213 @@
+"""
+Unit tests for notification manager.
+"""
+
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from utils.notifications import NotificationManager, get_notification_manager
+
+
+class TestNotificationManager(unittest.TestCase):
+    """Test cases for NotificationManager class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        # Force the osascript path regardless of the host platform
+        with patch('utils.notifications.sys.platform', 'darwin'), \
+             patch('utils.notifications._NATIVE_OK', False):
+            self.manager = NotificationManager()
+        self.sent = []
+        self.manager._send_osascript = lambda *args: self.sent.append(args)
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.manager.shutdown()
+    
+    def test_send_is_delivered_by_worker(self):
+        """Test that queued notifications are delivered before shutdown returns."""
+        self.manager.send("Title", "Message", "Subtitle")
+        self.manager.send("Title", "Second")
+        self.manager.shutdown()
+        
+        self.assertEqual(self.sent, [
+            ("Title", "Message", "Subtitle"),
+            ("Title", "Second", None)
+        ])
+    
+    def test_worker_restarts_after_shutdown(self):
+        """Test that send() after shutdown() starts a new worker."""
+        self.manager.send("Title", "First")
+        self.manager.shutdown()
+        self.manager.send("Title", "Second")
+        self.manager.shutdown()
+        
+        self.assertEqual([message for _, message, _ in self.sent], ["First", "Second"])
+    
+    def test_send_progress_coalesces_updates(self):
+        """Test that rapid progress updates are collapsed."""
+        with patch('utils.notifications.time.monotonic', return_value=100.0):
+            for current in range(1, 101):
+                self.manager.send_progress(current, 100)
+        self.manager.shutdown()
+        
+        # One notification per 5% step (1, 6, ..., 96), plus the final item
+        messages = [message for _, message, _ in self.sent]
+        self.assertEqual(len(messages), 21)
+        self.assertEqual(messages[1], "Processing: 6/100 (6%)")
+        self.assertEqual(messages[-1], "Processing: 100/100 (100%)")
+    
+    def test_send_progress_resets_between_batches(self):
+        """Test that a batch started right after another is not throttled."""
+        with patch('utils.notifications.time.monotonic', return_value=100.0):
+            for current in range(1, 5):
+                self.manager.send_progress(current, 4)
+            for current in range(1, 3):
+                self.manager.send_progress(current, 100)
+        self.manager.shutdown()
+        
+        messages = [message for _, message, _ in self.sent]
+        self.assertEqual(messages, [
+            "Processing: 1/4 (25%)",
+            "Processing: 2/4 (50%)",
+            "Processing: 3/4 (75%)",
+            "Processing: 4/4 (100%)",
+            "Processing: 1/100 (1%)"
+        ])
+    
+    def test_send_progress_resets_when_percentage_drops(self):
+        """Test that an unfinished batch does not throttle the next one."""
+        with patch('utils.notifications.time.monotonic', return_value=100.0):
+            self.manager.send_progress(8, 10)
+            self.manager.send_progress(1, 10)
+        self.manager.shutdown()
+        
+        messages = [message for _, message, _ in self.sent]
+        self.assertEqual(messages, ["Processing: 8/10 (80%)", "Processing: 1/10 (10%)"])
+    
+    @patch('utils.notifications.subprocess.Popen')
+    def test_osascript_process_is_reused(self, mock_popen):
+        """Test that one osascript interpreter serves every notification."""
+        process = MagicMock()
+        process.poll.return_value = None
+        mock_popen.return_value = process
+        manager = NotificationManager()
+        
+        manager._send_osascript("Title", "First")
+        manager._send_osascript("Title", "Second\nLine", "Sub")
+        manager.shutdown()
+        
+        mock_popen.assert_called_once()
+        process.stdin.write.assert_any_call('display notification "First" with title "Title"\n')
+        process.stdin.write.assert_any_call(
+            'display notification "Second\\nLine" with title "Title" subtitle "Sub"\n'
+        )
+        process.stdin.close.assert_called_once()
+    
+    @patch('utils.notifications.subprocess.Popen')
+    def test_osascript_escapes_strings(self, mock_popen):
+        """Test that quotes and backslashes cannot break the AppleScript literal."""
+        process = MagicMock()
+        process.poll.return_value = None
+        mock_popen.return_value = process
+        manager = NotificationManager()
+        
+        manager._send_osascript('Say "hi"', 'C:\\temp\\file.pdf')
+        manager.shutdown()
+        
+        process.stdin.write.assert_called_once_with(
+            'display notification "C:\\\\temp\\\\file.pdf" with title "Say \\"hi\\""\n'
+        )
+    
+    def test_send_progress_message(self):
+        """Test progress message formatting, including a literal percent sign."""
+        self.manager.send_progress(2, 3, "PDF Analysis")
+        self.manager.send_progress(3, 3, "100% check")
+        self.manager.shutdown()
+        
+        self.assertEqual(self.sent, [
+            ("PDF Knowledge Extractor", "PDF Analysis: 2/3 (67%)", "Processing pdf analysis"),
+            ("PDF Knowledge Extractor", "100% check: 3/3 (100%)", "Processing 100% check")
+        ])
+    
+    def test_send_error_batches_errors(self):
+        """Test that a burst of errors becomes one summary notification."""
+        for name in ["a.pdf", "b.pdf", "c.pdf", "d.pdf"]:
+            self.manager.send_error("failed", name)
+        self.manager.send_completion(0, 4)
+        self.manager.shutdown()
+        
+        messages = [message for _, message, _ in self.sent]
+        self.assertEqual(messages, [
+            "4 errors: a.pdf, b.pdf, c.pdf, …",
+            "Processed 0/4 files (4 failed)"
+        ])
+    
+    def test_single_error_keeps_detail(self):
+        """Test that a lone error is reported with its message."""
+        self.manager.send_error("bad header", "a.pdf")
+        self.manager.shutdown()
+        
+        self.assertEqual(self.sent, [(
+            "PDF Knowledge Extractor Error",
+            "Error processing a.pdf: bad header",
+            "An error occurred"
+        )])
+    
+    @patch('utils.notifications.sys.platform', 'darwin')
+    @patch('utils.notifications._NATIVE_OK', True)
+    @patch('utils.notifications._NSUserNotificationCenter')
+    @patch('utils.notifications._NSUserNotification')
+    def test_native_center_is_cached(self, mock_notification, mock_center_cls):
+        """Test that the notification center is looked up once."""
+        manager = NotificationManager()
+        
+        manager._send_native("Title", "First")
+        manager._send_native("Title", "Second", "Sub")
+        
+        mock_center_cls.defaultUserNotificationCenter.assert_called_once()
+        center = mock_center_cls.defaultUserNotificationCenter.return_value
+        self.assertEqual(center.deliverNotification_.call_count, 2)
+        mock_notification.new.return_value.setSubtitle_.assert_called_once_with("Sub")
+    
+    @patch('utils.notifications.sys.platform', 'linux')
+    def test_disabled_off_macos(self):
+        """Test that every sender is a no-op outside macOS."""
+        manager = NotificationManager()
+        
+        self.assertFalse(manager.enabled)
+        manager.send("Title", "Message")
+        manager.send_progress(1, 2)
+        manager.send_completion(1, 2)
+        manager.send_error("boom", "file.pdf")
+        
+        self.assertIsNone(manager._worker_thread)
+        self.assertTrue(manager._queue.empty())
+    
+    def test_get_notification_manager_is_shared(self):
+        """Test that the accessor always returns the same instance."""
+        self.assertIs(get_notification_manager(), get_notification_manager())
+    
+    def test_delivery_error_is_logged(self):
+        """Test that a failing delivery does not stop the worker."""
+        def fail_once(title, message, subtitle):
+            if message == "bad":
+                raise OSError("osascript missing")
+            self.sent.append((title, message, subtitle))
+        self.manager._send_osascript = fail_once
+        
+        with patch.object(self.manager.logger, "error") as mock_error:
+            self.manager.send("Title", "bad")
+            self.manager.send("Title", "good")
+            self.manager.shutdown()
+        
+        mock_error.assert_called_once()
+        self.assertEqual(self.sent, [("Title", "good", None)])
+
+
+if __name__ == '__main__':
+    unittest.main()